@@ -0,0 +1,41 @@
+"""Порівняння пам'яті та швидкості LinkedList (вузли-об'єкти) і ArrayLinkedList (масиви)."""
+import random
+import sys
+import time
+import tracemalloc
+
+from task_1 import ArrayLinkedList, LinkedList
+
+
+def measure(name, factory, data):
+    """Будує список з data, сортує його та виводить пам'ять і час."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    lst = factory()
+    for value in data:
+        lst.insert_at_end(value)
+    build_time = time.perf_counter() - start
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    lst.merge_sort()
+    sort_time = time.perf_counter() - start
+
+    per_item = memory / len(data)
+    print(f"{name:<28} | {memory / 2**20:>9.1f} MiB | {per_item:>7.1f} B | "
+          f"{build_time:>8.2f} s | {sort_time:>8.2f} s")
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    data = [random.randint(0, 10**9) for _ in range(n)]
+
+    print(f"\nКількість елементів: {n}\n")
+    header = ("Реалізація", "Пам'ять", "На елемент", "Побудова", "Сортування")
+    print("{:<28} | {:>13} | {:>10} | {:>10} | {:>10}".format(*header))
+    print("-" * 85)
+    measure("LinkedList (Node)", LinkedList, data)
+    measure("ArrayLinkedList (list)", ArrayLinkedList, data)
+    measure("ArrayLinkedList ('q')", lambda: ArrayLinkedList(typecode="q"), data)
+    print()
@@ -0,0 +1,188 @@
+"""Порівняння продуктивності різних реалізацій найкоротших шляхів з task_3."""
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from functools import partial
+
+from task_3 import BucketQueue, CSRGraph, Graph, IndexedDaryHeap, Landmarks, load_edge_list
+
+
+def grid_graph(side, seed=42):
+    """Граф-«мапа доріг»: решітка side x side з випадковими вагами ребер."""
+    rng = random.Random(seed)
+    graph = Graph()
+    for r in range(side):
+        for c in range(side):
+            if c + 1 < side:
+                graph.add_edge((r, c), (r, c + 1), rng.randint(1, 100))
+            if r + 1 < side:
+                graph.add_edge((r, c), (r + 1, c), rng.randint(1, 100))
+    return graph
+
+
+def dense_graph(n, probability=0.5, seed=42):
+    """Щільний граф: кожна пара вершин з'єднана з імовірністю probability."""
+    rng = random.Random(seed)
+    graph = Graph()
+    for u in range(n):
+        for v in range(u + 1, n):
+            if rng.random() < probability:
+                graph.add_edge(u, v, rng.randint(1, 100))
+    return graph
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def bench_csr(side, queries=5):
+    """Пам'ять і час Дейкстри: словник списків проти CSR."""
+    tracemalloc.start()
+    graph = grid_graph(side)
+    dict_memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    csr = graph.freeze()
+    csr_memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    sources = random.Random(1).sample(list(graph.adj_list), queries)
+    dict_time = sum(timed(graph.dijkstra, s)[1] for s in sources) / queries
+    csr_time = sum(timed(csr.dijkstra, s)[1] for s in sources) / queries
+    csr_ids_time = sum(timed(csr.dijkstra_ids, csr.ids[s])[1] for s in sources) / queries
+
+    print(f"\nCSR проти adj_list (вершин: {csr.num_vertices}, ребер: {csr.num_edges})")
+    print(f"  Пам'ять графа: adj_list {dict_memory / 2**20:.1f} MiB, "
+          f"CSR {csr_memory / 2**20:.1f} MiB")
+    print(f"  Дейкстра (середнє з {queries}): adj_list {dict_time:.3f} с, "
+          f"CSR {csr_time:.3f} с, CSR на id {csr_ids_time:.3f} с")
+
+
+def bench_point_to_point(side, queries=20):
+    """Час одного запиту start -> target: повна Дейкстра, рання зупинка, двонаправлений пошук."""
+    graph = grid_graph(side)
+    rng = random.Random(2)
+    vertices = list(graph.adj_list)
+    pairs = [(rng.choice(vertices), rng.choice(vertices)) for _ in range(queries)]
+
+    def full(s, t):
+        distances, previous = graph.dijkstra(s)
+        return distances[t], graph.get_shortest_path(previous, s, t)
+
+    print(f"\nЗапити start -> target (середнє з {queries})")
+    for name, query in (("dijkstra + get_shortest_path", full),
+                        ("shortest_path", graph.shortest_path),
+                        ("shortest_path, bidirectional",
+                         lambda s, t: graph.shortest_path(s, t, bidirectional=True))):
+        elapsed = sum(timed(query, s, t)[1] for s, t in pairs) / queries
+        print(f"  {name:<30} {elapsed * 1000:8.1f} мс")
+
+
+def bench_astar(side, queries=20, landmarks=8):
+    """A* з орієнтирами (ALT) та координатами проти Дейкстри: час і кількість розглянутих вершин."""
+    graph = grid_graph(side)
+    rng = random.Random(3)
+    vertices = list(graph.adj_list)
+    pairs = [(rng.choice(vertices), rng.choice(vertices)) for _ in range(queries)]
+
+    alt, build_time = timed(Landmarks.build, graph, landmarks, 0)
+
+    def manhattan(vertex, target):
+        # мінімальна вага ребра в grid_graph - 1
+        return abs(vertex[0] - target[0]) + abs(vertex[1] - target[1])
+
+    print(f"\nA* (середнє з {queries}; побудова {landmarks} орієнтирів: {build_time:.2f} с)")
+    for name, heuristic in (("Дейкстра (без евристики)", None),
+                            ("A* + координати", manhattan),
+                            ("A* + ALT", alt)):
+        settled = 0
+        elapsed = 0.0
+        for s, t in pairs:
+            stats = {}
+            elapsed += timed(graph.astar, s, t, heuristic, stats)[1]
+            settled += stats["settled"]
+        elapsed /= queries
+        share = settled / queries / len(vertices) * 100
+        print(f"  {name:<26} {elapsed * 1000:8.1f} мс, розглянуто {share:5.1f}% вершин")
+
+
+def bench_many_to_many(side, sources=200):
+    """Матриця відстаней sources x усі вершини при різній кількості процесів."""
+    csr = grid_graph(side).freeze()
+    chosen = random.Random(4).sample(csr.names, sources)
+
+    print(f"\nmany_to_many: {sources} джерел x {csr.num_vertices} вершин")
+    workers = 1
+    while workers <= (os.cpu_count() or 1):
+        _, elapsed = timed(lambda: csr.many_to_many(chosen, max_workers=workers))
+        print(f"  процесів: {workers:<3} {elapsed:7.2f} с, {sources / elapsed:8.1f} джерел/с")
+        workers *= 2
+
+
+def bench_queues(side, dense_n=400, queries=5):
+    """Дейкстра з різними чергами з пріоритетами на розрідженому та щільному графах."""
+    queues = (("heapq (ліниве видалення)", None),
+              ("IndexedDaryHeap, d=2", partial(IndexedDaryHeap, 2)),
+              ("IndexedDaryHeap, d=4", partial(IndexedDaryHeap, 4)),
+              ("IndexedDaryHeap, d=8", partial(IndexedDaryHeap, 8)),
+              ("BucketQueue (Діал)", BucketQueue))
+
+    for title, graph in ((f"розріджений (решітка {side}x{side})", grid_graph(side)),
+                         (f"щільний ({dense_n} вершин)", dense_graph(dense_n))):
+        sources = random.Random(5).sample(list(graph.adj_list), queries)
+        print(f"\nЧерги з пріоритетами, граф {title}")
+        for name, queue in queues:
+            elapsed = sum(timed(graph.dijkstra, s, queue)[1] for s in sources) / queries
+            print(f"  {name:<26} {elapsed * 1000:8.1f} мс")
+
+
+def bench_loading(edges=1_000_000):
+    """Побудова графа: add_edge у циклі, load_edge_list з CSV та знімок через memmap."""
+    rng = random.Random(6)
+    n = edges // 4
+    rows = [(rng.randrange(n), rng.randrange(n), rng.randint(1, 100)) for _ in range(edges)]
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "edges.csv")
+        with open(path, "w") as file:
+            file.writelines(f"{u},{v},{w}\n" for u, v, w in rows)
+
+        def by_add_edge():
+            graph = Graph()
+            for u, v, w in rows:
+                graph.add_edge(u, v, w)
+            return graph
+
+        _, add_time = timed(by_add_edge)
+        csr, csv_time = timed(load_edge_list, path, ",")
+        snapshot = os.path.join(directory, "snapshot")
+        csr.save(snapshot)
+        _, load_time = timed(CSRGraph.load, snapshot)
+
+        # Знімок має зберігати і складені імена вершин (кортежі решітки)
+        grid = grid_graph(4).freeze()
+        grid.save(snapshot)
+        restored = CSRGraph.load(snapshot)
+        assert restored.names == grid.names
+        assert restored.dijkstra((0, 0)) == grid.dijkstra((0, 0))
+
+    print(f"\nЗавантаження графа з {edges} ребер")
+    print(f"  add_edge у циклі          {add_time:8.2f} с")
+    print(f"  load_edge_list (CSV)      {csv_time:8.2f} с")
+    print(f"  CSRGraph.load (memmap)    {load_time:8.2f} с")
+
+
+if __name__ == "__main__":
+    side = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    bench_csr(side)
+    bench_point_to_point(side)
+    bench_astar(side)
+    bench_many_to_many(side)
+    bench_queues(side)
+    bench_loading()
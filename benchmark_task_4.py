@@ -0,0 +1,63 @@
+"""Мікробенчмарки куп з task_4 проти heapq та вибір оптимальної арності d."""
+import heapq
+import random
+import sys
+import time
+
+from task_4 import DaryHeap, IndexedHeap
+
+
+def timed(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def heapq_push_pop(values):
+    heap = []
+    for value in values:
+        heapq.heappush(heap, value)
+    while heap:
+        heapq.heappop(heap)
+
+
+def dary_push_pop(values, d):
+    heap = DaryHeap(d=d)
+    for value in values:
+        heap.push(value)
+    while heap:
+        heap.pop()
+
+
+def indexed_scheduler(values, d, decreases):
+    """Типове навантаження планувальника: вставки, зменшення пріоритетів, вилучення."""
+    heap = IndexedHeap(d=d)
+    handles = [heap.push(i, value) for i, value in enumerate(values)]
+    rng = random.Random(1)
+    for _ in range(decreases):
+        handle = rng.choice(handles)
+        if handle in heap:
+            heap.decrease_key(handle, handle.priority - rng.random())
+        if rng.random() < 0.3 and heap:
+            heap.pop()
+    while heap:
+        heap.pop()
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    values = [random.random() for _ in range(n)]
+
+    print(f"\nКількість елементів: {n}\n")
+    print(f"{'Операція':<34} | {'Час, с':>8}")
+    print("-" * 46)
+    print(f"{'heapq: push + pop':<34} | {timed(lambda: heapq_push_pop(values)):>8.3f}")
+    print(f"{'heapq.heapify':<34} | {timed(lambda: heapq.heapify(list(values))):>8.3f}")
+    for d in (2, 3, 4, 8):
+        push_pop = timed(lambda: dary_push_pop(values, d))
+        build = timed(lambda: DaryHeap(values, d=d))
+        scheduler = timed(lambda: indexed_scheduler(values, d, n))
+        print(f"{f'DaryHeap d={d}: push + pop':<34} | {push_pop:>8.3f}")
+        print(f"{f'DaryHeap d={d}: heapify':<34} | {build:>8.3f}")
+        print(f"{f'IndexedHeap d={d}: планувальник':<34} | {scheduler:>8.3f}")
+    print()
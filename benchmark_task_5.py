@@ -0,0 +1,50 @@
+"""Побудова та обходи дерева: об'єкти Node проти компактного ArrayTree з task_5."""
+import sys
+import time
+import tracemalloc
+
+from task_5 import ArrayTree, Node, bfs_order, dfs_order
+
+
+def build_nodes(n):
+    """Повне дерево з n об'єктів Node (як у купі)."""
+    nodes = [Node(i) for i in range(n)]
+    for i, node in enumerate(nodes):
+        if 2 * i + 1 < n:
+            node.left = nodes[2 * i + 1]
+        if 2 * i + 2 < n:
+            node.right = nodes[2 * i + 2]
+    return nodes[0] if nodes else None
+
+
+def measure(build, n):
+    tracemalloc.start()
+    start = time.perf_counter()
+    tree = build(n)
+    elapsed = time.perf_counter() - start
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return tree, elapsed, memory
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+    root, node_time, node_memory = measure(build_nodes, n)
+    tree, array_time, array_memory = measure(lambda k: ArrayTree.complete(range(k)), n)
+
+    print(f"\nКількість вузлів: {n}\n")
+    header = ("Реалізація", "Побудова, с", "Пам'ять, MiB", "DFS, с", "BFS, с")
+    print("{:<12} | {:>12} | {:>12} | {:>8} | {:>8}".format(*header))
+    print("-" * 64)
+    print(f"{'Node':<12} | {node_time:>12.2f} | {node_memory / 2**20:>12.1f} | "
+          f"{timed(dfs_order, root):>8.2f} | {timed(bfs_order, root):>8.2f}")
+    print(f"{'ArrayTree':<12} | {array_time:>12.2f} | {array_memory / 2**20:>12.1f} | "
+          f"{timed(tree.dfs_order):>8.2f} | {timed(tree.bfs_order):>8.2f}")
+    print()
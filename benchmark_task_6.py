@@ -0,0 +1,56 @@
+"""Порівняння DP з повною таблицею (як було) та векторного рядка DP з task_6 на великих бюджетах."""
+import random
+import sys
+import time
+
+from task_6 import dynamic_programming
+
+
+def table_dynamic_programming(items, budget):
+    """Еталон: таблиця (n+1) x (budget+1) списками Python і вкладені цикли."""
+    names = list(items)
+    dp = [[0] * (budget + 1) for _ in range(len(names) + 1)]
+    for i, name in enumerate(names, 1):
+        cost, cal = items[name]["cost"], items[name]["calories"]
+        previous, row = dp[i - 1], dp[i]
+        for w in range(budget + 1):
+            row[w] = previous[w]
+            if cost <= w and previous[w - cost] + cal > row[w]:
+                row[w] = previous[w - cost] + cal
+    return dp[-1][budget]
+
+
+def random_items(n, max_cost, seed=1):
+    rng = random.Random(seed)
+    return {f"item{i}": {"cost": rng.randint(1, max_cost), "calories": rng.randint(1, 1000)}
+            for i in range(n)}
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    budget = int(sys.argv[2]) if len(sys.argv) > 2 else 1_000_000
+
+    print(f"\n{'Задача':<28} | {'Метод':<22} | {'Калорій':>10} | {'Час, с':>8}")
+    print("-" * 78)
+
+    small = random_items(200, 500)
+    expected, table_time = timed(lambda: table_dynamic_programming(small, 10_000))
+    (_, _, calories), fast_time = timed(lambda: dynamic_programming(small, 10_000))
+    assert calories == expected
+    print(f"{'n=200, бюджет=10000':<28} | {'таблиця Python':<22} | {expected:>10} | {table_time:>8.3f}")
+    print(f"{'n=200, бюджет=10000':<28} | {'рядок NumPy + біти':<22} | {calories:>10} | {fast_time:>8.3f}")
+
+    large = random_items(n, budget // 100)
+    label = f"n={n}, бюджет={budget}"
+    for method, limit in (("рядок NumPy + біти", 2 ** 40), ("Гіршберг, O(budget)", 0)):
+        (_, cost, calories), elapsed = timed(
+            lambda: dynamic_programming(large, budget, max_decision_bytes=limit))
+        assert cost <= budget
+        print(f"{label:<28} | {method:<22} | {calories:>10} | {elapsed:>8.3f}")
+    print()
@@ -1,27 +1,207 @@
+import heapq
+from array import array
+from operator import itemgetter
+
+
+NIL = -1         # "порожній" індекс у ArrayLinkedList (аналог None)
+_END = object()  # маркер вичерпаного ітератора
+
+
+def _identity(x):
+    return x
+
+
+_decorated_key = itemgetter(0)   # ключ вузла, обчислений заздалегідь у merge_sort
+
+
 class Node:
+    # __slots__ прибирає __dict__ у кожного вузла й економить пам'ять на великих списках
+    __slots__ = ("data", "next")
+
     def __init__(self, data=None):
         self.data = data
         self.next = None
 
 
 class LinkedList:
-    def __init__(self):
-        self.head = None
+    def __init__(self, iterable=None, indexed=False):
+        """indexed=True вмикає хеш-індекс: пошук, видалення та `in` за O(1) у середньому.
+
+        Індекс - це словник значення -> [перше, останнє входження], двозв'язний ланцюжок
+        входжень одного значення у порядку списку та словник вузол -> попередній вузол.
+        Значення мають бути хешованими. Якщо значення повторюються, search_element/delete_node,
+        як і без індексу, працюють з першим входженням. Вставка на початок і в кінець - O(1);
+        insert_after у середину коштує O(відстань до найближчого входження того ж значення
+        або до краю списку).
+        """
+        self._head = None
+        self._tail = None   # останній вузол - для вставки в кінець за O(1)
+        self._size = 0      # кількість вузлів - для len() за O(1)
+        self._index = {} if indexed else None   # значення -> [перше, останнє входження]
+        self._dup = {} if indexed else None     # вузол -> [попереднє, наступне входження]
+        self._prev = {} if indexed else None    # вузол -> попередній вузол
+        if iterable is not None:
+            self.extend(iterable)
+
+    @property
+    def head(self):
+        return self._head
+
+    @head.setter
+    def head(self, node):
+        """Пряме присвоєння голови: хвіст і розмір перераховуються за O(n)."""
+        self._head = node
+        self._recount()
+
+    def _recount(self):
+        """Проходить ланцюжок від голови й відновлює хвіст та розмір."""
+        size = 0
+        tail = None
+        cur = self._head
+        while cur:
+            size += 1
+            tail = cur
+            cur = cur.next
+        self._tail = tail
+        self._size = size
+        self._rebuild_index()
+
+    def _rebuild_index(self):
+        """Перебудовує індекс за O(n) після операцій, що переставляють вузли."""
+        if self._index is None:
+            return
+        index = {}
+        dup = {}
+        prev_map = {}
+        prev = None
+        cur = self._head
+        while cur:
+            entry = index.get(cur.data)
+            if entry is None:
+                index[cur.data] = [cur, cur]
+                dup[cur] = [None, None]
+            else:
+                dup[entry[1]][1] = cur
+                dup[cur] = [entry[1], None]
+                entry[1] = cur
+            prev_map[cur] = prev
+            prev = cur
+            cur = cur.next
+        self._index = index
+        self._dup = dup
+        self._prev = prev_map
+
+    def _index_add(self, node, prev):
+        """Реєструє новий вузол node, що стоїть одразу після prev."""
+        self._prev[node] = prev
+        if node.next is not None:
+            self._prev[node.next] = node
+
+        entry = self._index.get(node.data)
+        if entry is None:
+            self._bucket_link(node, None, None)
+        elif node.next is None:
+            self._bucket_link(node, entry[1], None)     # вставка в кінець
+        elif prev is None:
+            self._bucket_link(node, None, entry[0])     # вставка на початок
+        else:
+            # Найближче входження того ж значення: крокуємо одночасно назад і вперед
+            back, forward = prev, node.next
+            while True:
+                if back is None:
+                    self._bucket_link(node, None, entry[0])
+                    return
+                if back.data == node.data:
+                    self._bucket_link(node, back, self._dup[back][1])
+                    return
+                if forward is None:
+                    self._bucket_link(node, entry[1], None)
+                    return
+                if forward.data == node.data:
+                    self._bucket_link(node, self._dup[forward][0], forward)
+                    return
+                back = self._prev[back]
+                forward = forward.next
+
+    def _bucket_link(self, node, before, after):
+        """Вставляє node у ланцюжок входжень між сусідніми входженнями before і after."""
+        self._dup[node] = [before, after]
+        entry = self._index.get(node.data)
+        if entry is None:
+            self._index[node.data] = [node, node]
+            return
+        if before is None:
+            entry[0] = node
+        else:
+            self._dup[before][1] = node
+        if after is None:
+            entry[1] = node
+        else:
+            self._dup[after][0] = node
+
+    def _bucket_unlink(self, node):
+        before, after = self._dup.pop(node)
+        entry = self._index[node.data]
+        if before is None:
+            entry[0] = after
+        else:
+            self._dup[before][1] = after
+        if after is None:
+            entry[1] = before
+        else:
+            self._dup[after][0] = before
+        if entry[0] is None:
+            del self._index[node.data]
+
+    def _clear(self):
+        """Забирає всі вузли зі списку (вони перейшли до іншого списку)."""
+        self._head = self._tail = None
+        self._size = 0
+        if self._index is not None:
+            self._index = {}
+            self._dup = {}
+            self._prev = {}
+
+    def __contains__(self, data):
+        if self._index is not None:
+            return data in self._index
+        return self.search_element(data) is not None
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        cur = self._head
+        while cur:
+            yield cur.data
+            cur = cur.next
 
     def insert_at_beginning(self, data):
         new_node = Node(data)
-        new_node.next = self.head
-        self.head = new_node
+        new_node.next = self._head
+        self._head = new_node
+        if self._tail is None:
+            self._tail = new_node
+        self._size += 1
+        if self._index is not None:
+            self._index_add(new_node, None)
 
     def insert_at_end(self, data):
         new_node = Node(data)
-        if self.head is None:
-            self.head = new_node
+        prev = self._tail
+        if self._head is None:
+            self._head = new_node
         else:
-            cur = self.head
-            while cur.next:
-                cur = cur.next
-            cur.next = new_node
+            self._tail.next = new_node
+        self._tail = new_node
+        self._size += 1
+        if self._index is not None:
+            self._index_add(new_node, prev)
+
+    def extend(self, iterable):
+        """Додає всі елементи iterable в кінець списку за лінійний час."""
+        for data in iterable:
+            self.insert_at_end(data)
 
     def insert_after(self, prev_node: Node, data):
         if prev_node is None:
@@ -30,11 +210,22 @@ class LinkedList:
         new_node = Node(data)
         new_node.next = prev_node.next
         prev_node.next = new_node
+        if prev_node is self._tail:
+            self._tail = new_node
+        self._size += 1
+        if self._index is not None:
+            self._index_add(new_node, prev_node)
 
     def delete_node(self, key: int):
-        cur = self.head
+        if self._index is not None:
+            self._delete_indexed(key)
+            return
+        cur = self._head
         if cur and cur.data == key:
-            self.head = cur.next
+            self._head = cur.next
+            if self._head is None:
+                self._tail = None
+            self._size -= 1
             cur = None
             return
         prev = None
@@ -44,9 +235,35 @@ class LinkedList:
         if cur is None:
             return
         prev.next = cur.next
+        if cur is self._tail:
+            self._tail = prev
+        self._size -= 1
         cur = None
 
+    def _delete_indexed(self, key):
+        """Видалення за O(1): вузол береться з індексу, попередник - з _prev."""
+        entry = self._index.get(key)
+        if entry is None:
+            return
+        cur = entry[0]
+        self._bucket_unlink(cur)
+        prev = self._prev.pop(cur)
+
+        if prev is None:
+            self._head = cur.next
+        else:
+            prev.next = cur.next
+        if cur.next is not None:
+            self._prev[cur.next] = prev
+        if cur is self._tail:
+            self._tail = prev
+        self._size -= 1
+        cur.next = None
+
     def search_element(self, data: int):
+        if self._index is not None:
+            entry = self._index.get(data)
+            return entry[0] if entry else None
         cur = self.head
         while cur:
             if cur.data == data:
@@ -65,7 +282,8 @@ class LinkedList:
     def reverse(self):
         """Реверсування однозв'язного списку."""
         prev = None
-        current = self.head
+        current = self._head
+        self._tail = current
 
         while current:
             nxt = current.next   # запам'ятовуємо наступний
@@ -73,24 +291,87 @@ class LinkedList:
             prev = current       # рухаємо prev і current вперед
             current = nxt
 
-        self.head = prev
+        self._head = prev
+        self._rebuild_index()
 
    
-    def merge_sort(self, head):
-        """Сортування однозв'язного списку методом злиття."""
+    def merge_sort(self, head=None, key=None, reverse=False):
+        """Сортування однозв'язного списку методом злиття (ітеративно, знизу вгору).
+
+        Без рекурсії: спочатку зливаємо пари підсписків довжини 1, потім 2, 4, ...
+        Вузли лише перечіпляються, тому додаткова пам'ять - O(1), а сортування стабільне.
+        Якщо head не передано, сортується сам список (self.head оновлюється).
+        key, reverse - як у вбудованій sorted().
+        """
+        in_place = head is None or head is self._head
+        if head is None:
+            head = self._head
 
         if head is None or head.next is None:
             return head
 
-        middle = self.get_middle(head)
-        next_to_middle = middle.next
-        middle.next = None
-
-        left = self.merge_sort(head)
-        right = self.merge_sort(next_to_middle)
+        # Довжина потрібна, щоб знати, коли зупинити подвоєння кроку
+        length = 0
+        cur = head
+        while cur:
+            length += 1
+            cur = cur.next
 
-        sorted_list = self.sorted_merge(left, right)
-        return sorted_list
+        # Ключ обчислюється один раз на вузол (як у sorted()), а не при кожному порівнянні:
+        # на час сортування data замінюється парою (ключ, data)
+        if key is not None:
+            cur = head
+            try:
+                while cur:
+                    cur.data = (key(cur.data), cur.data)
+                    cur = cur.next
+            except BaseException:
+                undo = head
+                while undo is not cur:
+                    undo.data = undo.data[1]
+                    undo = undo.next
+                raise
+            key = _decorated_key
+
+        dummy = Node()
+        dummy.next = head
+        prev = dummy
+        step = 1
+        completed = False
+
+        try:
+            while step < length:
+                prev = dummy
+                cur = dummy.next
+                while cur:
+                    left = cur
+                    right = self._split(left, step)
+                    cur = self._split(right, step)
+                    # _merge чіпляє злиті вузли одразу після prev і повертає хвіст
+                    _, prev = self._merge(left, right, key, reverse, prev)
+                step *= 2
+            completed = True
+        except BaseException:
+            # Порівняння впало (наприклад, несумісні типи): _merge уже причепив усі свої
+            # вузли після prev, лишається приєднати ще не оброблену частину проходу
+            while prev.next:
+                prev = prev.next
+            prev.next = cur
+            raise
+        finally:
+            if key is _decorated_key:
+                node = dummy.next
+                while node:
+                    node.data = node.data[1]
+                    node = node.next
+            if in_place:
+                self._head = dummy.next
+                if completed:
+                    self._tail = prev
+                    self._rebuild_index()
+                else:
+                    self._recount()
+        return dummy.next
 
     # Допоміжний метод
     def get_middle(self, head):
@@ -107,27 +388,395 @@ class LinkedList:
 
         return slow
 
-    # Алгоритм злиття двох відсортованих списків
-    def sorted_merge(self, a, b):
-        if a is None:
-            return b
-        if b is None:
-            return a
-
-        if a.data <= b.data:
-            result = a
-            result.next = self.sorted_merge(a.next, b)
-        else:
-            result = b
-            result.next = self.sorted_merge(a, b.next)
+    # Допоміжний метод
+    @staticmethod
+    def _split(head, step):
+        """Відрізає перші step вузлів від head і повертає початок решти списку."""
+        for _ in range(step - 1):
+            if head is None:
+                break
+            head = head.next
+        if head is None:
+            return None
+        rest = head.next
+        head.next = None
+        return rest
+
+    @staticmethod
+    def _merge(a, b, key=None, reverse=False, dummy=None):
+        """Ітеративне злиття двох відсортованих ланцюжків перечіплянням вузлів.
+
+        Повертає (голова, хвіст) злитого ланцюжка. При рівних ключах першим
+        іде вузол з a, тому злиття стабільне. dummy - вузол, після якого чіпляється
+        результат. Якщо key чи порівняння кидає виняток, решта a і b все одно
+        лишається причепленою, тож жоден вузол не губиться.
+        """
+        if dummy is None:
+            dummy = Node()
+        tail = dummy
+
+        if key is None:
+            key = _identity
+
+        try:
+            # Ключі поточних вузлів тримаємо в змінних: key викликається раз на взятий вузол
+            key_a = key(a.data) if a else None
+            key_b = key(b.data) if b else None
+            while a and b:
+                # Беремо з b лише тоді, коли він строго "раніший" за a
+                if reverse:
+                    take_b = key_a < key_b
+                else:
+                    take_b = key_b < key_a
+                if take_b:
+                    tail.next = tail = b
+                    b = b.next
+                    if b:
+                        key_b = key(b.data)
+                else:
+                    tail.next = tail = a
+                    a = a.next
+                    if a:
+                        key_a = key(a.data)
+        finally:
+            tail.next = a if a else b
+            if a and b:
+                end = a
+                while end.next:
+                    end = end.next
+                end.next = b
+
+        while tail.next:
+            tail = tail.next
+
+        return dummy.next, tail
 
-        return result
+    # Алгоритм злиття двох відсортованих списків
+    def sorted_merge(self, a, b, key=None, reverse=False):
+        head, _ = self._merge(a, b, key, reverse)
+        return head
 
    
     def merge_sorted_lists(self, list1, list2):
-        """Об'єднання двох відсортованих списків у один."""
-        return self.sorted_merge(list1.head, list2.head)
+        """Об'єднання двох відсортованих списків у один.
+
+        Вузли не копіюються, а перечіплюються; повертається голова злитого ланцюжка
+        (напр. merged.head = merged.merge_sorted_lists(a, b)). Голови list1 і list2
+        лишаються на своїх вузлах, тож обидва списки тепер вказують у спільний ланцюжок -
+        їхні хвости, розміри й індекси перераховуються відповідно. self не змінюється.
+        При рівних значеннях першим іде вузол з list1.
+        """
+        if list1 is list2:
+            raise ValueError("Не можна зливати список сам із собою")
+        head, _ = self._merge(list1._head, list2._head)
+        list1._recount()
+        list2._recount()
+        return head
+
+
+    def merge_many(self, *sources, key=None):
+        """K-шляхове злиття відсортованих LinkedList та ітераторів у self за O(N log k).
+
+        Купа (heapq) містить лише по одному поточному елементу з кожного джерела.
+        Вузли з LinkedList перечіплюються без копіювання (ці списки спорожнюються),
+        для значень з ітераторів створюються нові вузли в міру читання.
+        Поточний вміст self (має бути відсортований) - ще одне джерело, перше за порядком.
+        При рівних ключах порядок визначає номер джерела, тому злиття стабільне.
+        """
+        if key is None:
+            key = _identity
+        if self._head is not None:
+            sources = (self,) + sources
+
+        heap = []
+        iterators = {}
+        for i, source in enumerate(sources):
+            if isinstance(source, LinkedList):
+                node = source._head
+                source._clear()
+            else:
+                iterators[i] = iter(source)
+                data = next(iterators[i], _END)
+                node = None if data is _END else Node(data)
+            if node is not None:
+                heap.append((key(node.data), i, node))
+        heapq.heapify(heap)
+
+        dummy = Node()
+        tail = dummy
+        size = 0
+        while heap:
+            _, i, node = heap[0]
+            tail.next = node
+            tail = node
+            size += 1
+
+            if i in iterators:
+                data = next(iterators[i], _END)
+                following = None if data is _END else Node(data)
+            else:
+                following = node.next
+
+            if following is None:
+                heapq.heappop(heap)
+            else:
+                heapq.heapreplace(heap, (key(following.data), i, following))
+        tail.next = None
+
+        self._head = dummy.next
+        self._tail = tail if size else None
+        self._size = size
+        self._rebuild_index()
+        return self._head
+
+
+def merge_sorted_iterables(*sources, key=None, reverse=False):
+    """Ліниве k-шляхове злиття відсортованих джерел (LinkedList, ArrayLinkedList, ітератори).
+
+    Повертає генератор значень; у пам'яті тримається лише по одному елементу з джерела.
+    """
+    return heapq.merge(*sources, key=key, reverse=reverse)
+
+
+class ArrayLinkedList:
+    """Однозв'язний список на паралельних масивах.
+
+    Значення зберігаються в _values, індекси наступних комірок - в array('q') _next.
+    Звільнені комірки потрапляють у free-list і використовуються повторно.
+    Замість об'єктів Node методи повертають/приймають індекси комірок, NIL = кінець.
+    typecode (наприклад 'q' чи 'd') зберігає значення в компактному array замість list.
+    """
+
+    def __init__(self, iterable=None, typecode=None):
+        self._values = array(typecode) if typecode else []
+        self._next = array("q")
+        self._head = NIL
+        self._tail = NIL
+        self._size = 0
+        self._free = NIL    # голова ланцюжка вільних комірок
+        if iterable is not None:
+            self.extend(iterable)
+
+    @property
+    def head(self):
+        return self._head
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        values = self._values
+        nxt = self._next
+        cur = self._head
+        while cur != NIL:
+            yield values[cur]
+            cur = nxt[cur]
+
+    def value(self, index):
+        """Значення, що зберігається в комірці index."""
+        return self._values[index]
+
+    def _alloc(self, data):
+        """Бере комірку з free-list або дописує нову в кінець масивів."""
+        if self._free != NIL:
+            index = self._free
+            self._free = self._next[index]
+            self._values[index] = data
+            self._next[index] = NIL
+        else:
+            index = len(self._next)
+            self._values.append(data)
+            self._next.append(NIL)
+        return index
+
+    def _release(self, index):
+        """Повертає комірку у free-list."""
+        if isinstance(self._values, list):
+            self._values[index] = None  # не тримаємо посилання на видалений об'єкт
+        self._next[index] = self._free
+        self._free = index
+
+    def insert_at_beginning(self, data):
+        index = self._alloc(data)
+        self._next[index] = self._head
+        self._head = index
+        if self._tail == NIL:
+            self._tail = index
+        self._size += 1
+
+    def insert_at_end(self, data):
+        index = self._alloc(data)
+        if self._head == NIL:
+            self._head = index
+        else:
+            self._next[self._tail] = index
+        self._tail = index
+        self._size += 1
+
+    def extend(self, iterable):
+        """Додає всі елементи iterable в кінець списку за лінійний час."""
+        for data in iterable:
+            self.insert_at_end(data)
+
+    def insert_after(self, prev_index, data):
+        if prev_index is None or prev_index == NIL:
+            print("Попереднього вузла не існує.")
+            return
+        index = self._alloc(data)
+        self._next[index] = self._next[prev_index]
+        self._next[prev_index] = index
+        if prev_index == self._tail:
+            self._tail = index
+        self._size += 1
+
+    def delete_node(self, key):
+        values = self._values
+        nxt = self._next
+        prev = NIL
+        cur = self._head
+        while cur != NIL and values[cur] != key:
+            prev = cur
+            cur = nxt[cur]
+        if cur == NIL:
+            return
+        if prev == NIL:
+            self._head = nxt[cur]
+        else:
+            nxt[prev] = nxt[cur]
+        if cur == self._tail:
+            self._tail = prev
+        self._size -= 1
+        self._release(cur)
+
+    def search_element(self, data):
+        """Повертає індекс першої комірки зі значенням data або None."""
+        values = self._values
+        nxt = self._next
+        cur = self._head
+        while cur != NIL:
+            if values[cur] == data:
+                return cur
+            cur = nxt[cur]
+        return None
 
+    def print_list(self):
+        for data in self:
+            print(data, "--> ", end="")
+        print("None")
+
+    def reverse(self):
+        """Реверсування: змінюємо лише індекси в _next."""
+        nxt = self._next
+        prev = NIL
+        current = self._head
+        self._tail = current
+        while current != NIL:
+            following = nxt[current]
+            nxt[current] = prev
+            prev = current
+            current = following
+        self._head = prev
+
+    def merge_sort(self, key=None, reverse=False):
+        """Ітеративне стабільне сортування злиттям знизу вгору (на місці, без рекурсії)."""
+        if self._size < 2:
+            return
+
+        nxt = self._next
+        # Ключ обчислюється один раз на комірку й зберігається за її індексом
+        keys = self._values
+        if key is not None:
+            keys = [None] * len(self._values)
+            cur = self._head
+            while cur != NIL:
+                keys[cur] = key(self._values[cur])
+                cur = nxt[cur]
+
+        head = self._head
+        prev = NIL
+        step = 1
+
+        while step < self._size:
+            new_head = NIL
+            prev = NIL
+            cur = head
+            while cur != NIL:
+                left = cur
+                right = self._split(left, step)
+                cur = self._split(right, step)
+                merged_head, merged_tail = self._merge(left, right, keys, reverse)
+                if prev == NIL:
+                    new_head = merged_head
+                else:
+                    nxt[prev] = merged_head
+                prev = merged_tail
+            head = new_head
+            step *= 2
+
+        self._head = head
+        self._tail = prev
+
+    def _split(self, index, step):
+        """Відрізає step комірок від index і повертає індекс початку решти."""
+        nxt = self._next
+        for _ in range(step - 1):
+            if index == NIL:
+                break
+            index = nxt[index]
+        if index == NIL:
+            return NIL
+        rest = nxt[index]
+        nxt[index] = NIL
+        return rest
+
+    def _merge(self, a, b, keys, reverse):
+        """Злиття двох відсортованих ланцюжків індексів за ключами keys[індекс].
+        Повертає (голова, хвіст).
+        """
+        nxt = self._next
+        head = tail = NIL
+
+        while a != NIL and b != NIL:
+            if reverse:
+                take_b = keys[a] < keys[b]
+            else:
+                take_b = keys[b] < keys[a]
+            if take_b:
+                chosen = b
+                b = nxt[b]
+            else:
+                chosen = a
+                a = nxt[a]
+            if tail == NIL:
+                head = chosen
+            else:
+                nxt[tail] = chosen
+            tail = chosen
+
+        rest = a if a != NIL else b
+        if tail == NIL:
+            head = rest
+        else:
+            nxt[tail] = rest
+        while rest != NIL:
+            tail = rest
+            rest = nxt[rest]
+
+        return head, tail
+
+    def merge_sorted_lists(self, list1, list2):
+        """Об'єднання двох відсортованих списків у один.
+
+        На відміну від LinkedList.merge_sorted_lists, комірки різних списків лежать
+        в окремих буферах і перечепити їх не можна, тому значення копіюються:
+        повертається новий ArrayLinkedList (з тим самим typecode, що й self),
+        а self, list1 і list2 не змінюються.
+        """
+        merged = ArrayLinkedList(
+            typecode=self._values.typecode if isinstance(self._values, array) else None
+        )
+        merged.extend(heapq.merge(list1, list2))
+        return merged
 
 if __name__ == '__main__':
 
@@ -145,7 +794,7 @@ if __name__ == '__main__':
     print("\nЗв'язний список після реверсування:")
     first_list.print_list()
 
-    first_list.head = first_list.merge_sort(first_list.head)
+    first_list.merge_sort()
     print("\nЗв'язний список відсортовано:")
     first_list.print_list()
 
@@ -159,12 +808,11 @@ if __name__ == '__main__':
     second_list.print_list()
     
     print("\nДругий список після сортування:")
-    second_list.head = second_list.merge_sort(second_list.head)
+    second_list.merge_sort()
     second_list.print_list()
 
-    merged_head = first_list.merge_sorted_lists(first_list, second_list)
     merged_list = LinkedList()
-    merged_list.head = merged_head
+    merged_list.head = merged_list.merge_sorted_lists(first_list, second_list)
 
     print("\nОб'єднаний відсортований список:")
     merged_list.print_list()
@@ -1,5 +1,14 @@
+import argparse
+import io
+import itertools
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
 import matplotlib.pyplot as plt
 import numpy as np
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
 
 
 def draw_tree(x, y, length, angle, depth):
@@ -30,22 +39,262 @@ def draw_tree(x, y, length, angle, depth):
     draw_tree(x2, y2, new_length, angle - 45, depth - 1)
 
 
+def tree_segments(depth, x=0, y=-1, length=1, angle=90, ratio=0.7, branch_angles=(45, -45)):
+    """
+    Обчислює всі гілки дерева Піфагора без рекурсії - рівень за рівнем цілими масивами NumPy.
+    ratio – у скільки разів коротшає кожна наступна гілка
+    branch_angles – повороти дочірніх гілок відносно батьківської (в градусах)
+    Повертає масив форми (N, 2, 2): для кожної гілки [[x1, y1], [x2, y2]].
+    """
+    deltas = np.radians(np.asarray(branch_angles, dtype=float))
+    fan_out = deltas.size
+
+    total = sum(fan_out ** level for level in range(depth))
+    segments = np.empty((total, 2, 2))
+
+    xs = np.array([x], dtype=float)
+    ys = np.array([y], dtype=float)
+    angles = np.array([np.radians(angle)])
+    pos = 0
+
+    for _ in range(depth):
+        # Кінці всіх гілок поточного рівня одразу
+        x2 = xs + length * np.cos(angles)
+        y2 = ys + length * np.sin(angles)
+
+        level = segments[pos:pos + xs.size]
+        level[:, 0, 0] = xs
+        level[:, 0, 1] = ys
+        level[:, 1, 0] = x2
+        level[:, 1, 1] = y2
+        pos += xs.size
+
+        # Кожна гілка породжує fan_out нових з її кінця
+        xs = np.repeat(x2, fan_out)
+        ys = np.repeat(y2, fan_out)
+        angles = (angles[:, None] + deltas).ravel()
+        length *= ratio
+
+    return segments
+
+
+def iter_tree_segments(depth, x=0, y=-1, length=1, angle=90, ratio=0.7,
+                       branch_angles=(45, -45), chunk_size=65536, min_length=0.0):
+    """
+    Потокова версія tree_segments: генератор, що видає гілки порціями
+    не більше chunk_size (масиви форми (n, 2, 2)).
+    min_length – гілки, коротші за цю довжину, та їхні нащадки не обчислюються.
+    Усі гілки одного рівня однакової довжини, тож відсікання зупиняє побудову
+    на першому "невидимому" рівні - depth=30 коштує стільки ж, скільки видима деталізація.
+    Порції розгортаються в глибину (стек), тож у пам'яті одночасно не більше
+    depth * fan_out порцій - O(depth * chunk_size * fan_out) незалежно від відсікання.
+    """
+    if depth <= 0:
+        return
+
+    deltas = np.radians(np.asarray(branch_angles, dtype=float))
+    fan_out = deltas.size
+
+    # Стек порцій: (рівень, x, y, кути) для коренів гілок цього рівня
+    stack = [(0, np.array([x], dtype=float), np.array([y], dtype=float),
+              np.array([np.radians(angle)]))]
+
+    while stack:
+        level, xs, ys, angles = stack.pop()
+        branch_length = length * ratio ** level
+        if branch_length < min_length:
+            continue
+
+        x2 = xs + branch_length * np.cos(angles)
+        y2 = ys + branch_length * np.sin(angles)
+
+        chunk = np.empty((xs.size, 2, 2))
+        chunk[:, 0, 0] = xs
+        chunk[:, 0, 1] = ys
+        chunk[:, 1, 0] = x2
+        chunk[:, 1, 1] = y2
+        yield chunk
+
+        if level + 1 >= depth or branch_length * ratio < min_length:
+            continue
+
+        child_x = np.repeat(x2, fan_out)
+        child_y = np.repeat(y2, fan_out)
+        child_angles = (angles[:, None] + deltas).ravel()
+        # У зворотному порядку, щоб перша порція нащадків оброблялась першою
+        for start in reversed(range(0, child_x.size, chunk_size)):
+            stop = start + chunk_size
+            stack.append((level + 1, child_x[start:stop], child_y[start:stop],
+                          child_angles[start:stop]))
+
+
+def min_branch_length(size, dpi, length=1, ratio=0.7, min_pixels=0.5):
+    """
+    Довжина гілки (в координатах дерева), що на полотні size (дюйми) при dpi
+    займає min_pixels пікселів. Розмір дерева оцінюється зверху як 2 * length / (1 - ratio).
+    """
+    if ratio >= 1:
+        return 0.0
+    extent = 2 * length / (1 - ratio)
+    return min_pixels * extent / (min(size) * dpi)
+
+
+def draw_segments(ax, segments, color='brown', linewidth=1.5):
+    """Малює всі гілки одним LineCollection (один артист замість 2^depth ліній)."""
+    ax.add_collection(LineCollection(segments, colors=color, linewidths=linewidth))
+    ax.autoscale_view()
+    ax.set_aspect('equal')
+
+
+def render_tree(depth, output=None, fmt=None, size=(8, 8), dpi=100,
+                color='brown', linewidth=1.5, min_pixels=0.5, **tree_params):
+    """
+    Малює дерево без інтерактивного вікна (Figure без pyplot) і зберігає його.
+    output – шлях або файловий об'єкт; якщо None, повертаються байти зображення
+    fmt – формат ('png', 'svg', ...); за замовчуванням береться з розширення шляху або 'png'
+    min_pixels – гілки, коротші за цю кількість пікселів, не обчислюються (None - малювати всі)
+    tree_params – параметри tree_segments (x, y, length, angle, ratio, branch_angles)
+    """
+    if fmt is None:
+        if isinstance(output, (str, os.PathLike)):
+            fmt = os.path.splitext(os.fspath(output))[1].lstrip('.').lower() or 'png'
+        else:
+            fmt = 'png'
+
+    fig = Figure(figsize=size)
+    ax = fig.add_subplot()
+    ax.axis('off')
+
+    min_length = 0.0
+    if min_pixels is not None:
+        min_length = min_branch_length(size, dpi, tree_params.get('length', 1),
+                                       tree_params.get('ratio', 0.7), min_pixels)
+    for chunk in iter_tree_segments(depth, min_length=min_length, **tree_params):
+        draw_segments(ax, chunk, color=color, linewidth=linewidth)
+
+    if output is None:
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format=fmt, dpi=dpi)
+        return buffer.getvalue()
+
+    fig.savefig(output, format=fmt, dpi=dpi)
+    return output
+
+
+def parameter_grid(depths, ratios, spreads, fmt='png'):
+    """
+    Усі комбінації глибини, коефіцієнта зменшення та кута розгалуження.
+    Кожна комбінація - окрема задача з іменем файлу, що описує її параметри.
+    """
+    jobs = []
+    for depth, ratio, spread in itertools.product(depths, ratios, spreads):
+        jobs.append({
+            'name': f"tree_d{depth}_r{ratio:g}_a{spread:g}.{fmt}",
+            'depth': depth,
+            'ratio': ratio,
+            'branch_angles': (spread, -spread),
+        })
+    return jobs
+
+
+def _render_job(job, out_dir, render_options):
+    """Виконується в окремому процесі: малює одне дерево у файл і міряє час."""
+    start = time.perf_counter()
+    path = os.path.join(out_dir, job['name'])
+    params = {key: value for key, value in job.items() if key != 'name'}
+    render_tree(output=path, **params, **render_options)
+    return path, time.perf_counter() - start
+
+
+def render_batch(jobs, out_dir, max_workers=None, **render_options):
+    """
+    Паралельно малює дерева з jobs у пулі процесів і записує їх в out_dir.
+    Це генератор: повертає (шлях, час_у_секундах) для кожної задачі одразу,
+    щойно вона завершилась, тож результати потрапляють на диск потоком.
+    render_options – спільні параметри render_tree (size, dpi, color, ...).
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(_render_job, job, out_dir, render_options) for job in jobs]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Фрактал «дерево Піфагора».")
+    parser.add_argument("--depth", type=int, help="рівень рекурсії (без нього - запит з клавіатури)")
+    parser.add_argument("--ratio", type=float, default=0.7, help="коефіцієнт зменшення гілки")
+    parser.add_argument("--branch-angles", type=float, nargs="+", default=[45, -45],
+                        help="повороти дочірніх гілок у градусах")
+    parser.add_argument("--size", type=float, nargs=2, default=[8, 8], metavar=("W", "H"),
+                        help="розмір полотна в дюймах")
+    parser.add_argument("--dpi", type=int, default=100)
+    parser.add_argument("--output", "-o", help="файл для збереження (PNG/SVG); без нього - вікно")
+    parser.add_argument("--format", help="формат файлу, якщо не збігається з розширенням")
+
+    sweep = parser.add_argument_group("пакетна генерація (вмикається параметром --out-dir)")
+    sweep.add_argument("--out-dir", help="каталог для зображень усіх комбінацій параметрів")
+    sweep.add_argument("--depths", type=int, nargs="+", help="глибини (за замовчуванням --depth або 8)")
+    sweep.add_argument("--ratios", type=float, nargs="+", help="коефіцієнти (за замовчуванням --ratio)")
+    sweep.add_argument("--spreads", type=float, nargs="+", default=[45],
+                       help="кути розгалуження ±a у градусах")
+    sweep.add_argument("--workers", type=int, help="кількість процесів (за замовчуванням - усі ядра)")
+    return parser.parse_args(argv)
+
+
+def run_sweep(args):
+    """Пакетна генерація: друкує час кожної задачі та загальний час."""
+    fmt = args.format or 'png'
+    jobs = parameter_grid(args.depths or [args.depth or 8], args.ratios or [args.ratio],
+                          args.spreads, fmt=fmt)
+    print(f"Задач: {len(jobs)}")
+
+    start = time.perf_counter()
+    busy = 0.0
+    for path, elapsed in render_batch(jobs, args.out_dir, max_workers=args.workers,
+                                      size=tuple(args.size), dpi=args.dpi, fmt=fmt):
+        busy += elapsed
+        print(f"  {elapsed:7.2f} с  {path}")
+    total = time.perf_counter() - start
+
+    print(f"Загальний час: {total:.2f} с, сумарний час задач: {busy:.2f} с "
+          f"(прискорення x{busy / total if total else 0:.1f})")
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.out_dir:
+        run_sweep(args)
+        return
+
+    depth = args.depth
+
+    if depth is None:
+        # Запитуємо глибину у користувача
+        try:
+            depth = int(input("Введіть рівень рекурсії (рекомендовано 6–10): "))
+        except ValueError:
+            print("Некоректний ввід. Використано значення depth = 8")
+            depth = 8
+
+    # Початкові координати стовбура
+    tree_params = dict(x=0, y=-1, length=1, angle=90,
+                       ratio=args.ratio, branch_angles=args.branch_angles)
+
+    if args.output:
+        render_tree(depth, args.output, fmt=args.format, size=tuple(args.size),
+                    dpi=args.dpi, **tree_params)
+        print(f"Збережено: {args.output}")
+        return
 
-# Запитуємо глибину у користувача
-try:
-    depth = int(input("Введіть рівень рекурсії (рекомендовано 6–10): "))
-except ValueError:
-    print("Некоректний ввід. Використано значення depth = 8")
-    depth = 8
+    fig, ax = plt.subplots(figsize=tuple(args.size))
+    ax.axis('off')
 
-plt.figure(figsize=(8, 8))
-plt.axis('off')
+    # Малюємо дерево: усі гілки обчислюються векторно й малюються одним викликом
+    draw_segments(ax, tree_segments(depth, **tree_params))
 
-# Початкові координати стовбура
-start_x = 0
-start_y = -1
+    plt.show()
 
-# Малюємо дерево
-draw_tree(start_x, start_y, length=1, angle=90, depth=depth)
 
-plt.show()
\ No newline at end of file
+if __name__ == "__main__":
+    main()
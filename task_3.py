@@ -1,16 +1,48 @@
 import heapq
+import itertools
+import json
+import os
+import warnings
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import cached_property
+from multiprocessing import shared_memory
+
 import networkx as nx
 import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.collections import LineCollection
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
 
 class Graph:
-    def __init__(self):
+    def __init__(self, cache_size=0):
+        """cache_size - скільки результатів dijkstra (за джерелами) тримати в LRU-кеші.
+        0 - кеш вимкнено.
+        """
         # граф зберігаємо як словник: вершина -> список (сусід, вага)
         self.adj_list = {}
+        # вхідні ребра для пошуку у зворотному напрямку (будуються за потреби)
+        self._reverse_adj = None
+        # LRU-кеш: джерело -> (distances, previous)
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        # збережене розташування вершин для візуалізації (див. graph_layout)
+        self._layout = None
 
     def add_edge(self, u, v, weight, bidirectional=True):
         """Додає ребро u -> v з вагою weight.
         Якщо bidirectional=True, додає також v -> u.
         """
+        if u not in self.adj_list or v not in self.adj_list:
+            # Нова вершина змінює набір ключів у всіх результатах
+            self._cache.clear()
+        else:
+            self._invalidate(u, v, weight, bidirectional)
+
         if u not in self.adj_list:
             self.adj_list[u] = []
         if v not in self.adj_list:
@@ -19,12 +51,50 @@ class Graph:
         self.adj_list[u].append((v, weight))
         if bidirectional:
             self.adj_list[v].append((u, weight))
+        self._reverse_adj = None
 
-    def dijkstra(self, start):
+    def _invalidate(self, u, v, weight, bidirectional):
+        """Видаляє з кешу лише ті джерела, для яких нове ребро скорочує якийсь шлях."""
+        for source, (distances, _) in list(self._cache.items()):
+            if (distances[u] + weight < distances[v]
+                    or bidirectional and distances[v] + weight < distances[u]):
+                del self._cache[source]
+
+    def cache_info(self):
+        """Статистика кешу dijkstra (як у functools.lru_cache)."""
+        return CacheInfo(self._hits, self._misses, self.cache_size, len(self._cache))
+
+    def cache_clear(self):
+        self._cache.clear()
+        self._hits = self._misses = 0
+
+    def dijkstra(self, start, queue=None):
         """Алгоритм Дейкстри для знаходження найкоротших шляхів
         від вершини start до всіх інших вершин графа.
         Використовує бінарну купу (heapq).
+        queue - фабрика черги з пріоритетами зі зменшенням ключа
+        (IndexedDaryHeap, BucketQueue для малих цілих ваг); None - heapq.
+        Якщо кеш увімкнено, повторний запит з того самого джерела повертає
+        збережені словники (їх не слід змінювати).
         """
+        if queue is not None:
+            return self._dijkstra_decrease_key(start, queue)
+        if self.cache_size <= 0:
+            return self._dijkstra(start)
+
+        if start in self._cache:
+            self._hits += 1
+            self._cache.move_to_end(start)
+            return self._cache[start]
+
+        self._misses += 1
+        result = self._dijkstra(start)
+        self._cache[start] = result
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)   # витісняємо найдавніше використане
+        return result
+
+    def _dijkstra(self, start):
 
         # Початкові відстані: безкінечність для всіх, 0 для start
         distances = {vertex: float("inf") for vertex in self.adj_list}
@@ -55,6 +125,65 @@ class Graph:
 
         return distances, previous
 
+    def _dijkstra_decrease_key(self, start, queue_factory):
+        """Дейкстра з чергою, що підтримує зменшення ключа: кожна вершина
+        є в черзі щонайбільше один раз, застарілих записів немає.
+        """
+        distances = {vertex: float("inf") for vertex in self.adj_list}
+        distances[start] = 0
+        previous = {vertex: None for vertex in self.adj_list}
+
+        queue = queue_factory()
+        queue.push(start, 0)
+
+        while queue:
+            current_distance, current_vertex = queue.pop()
+            for neighbor, weight in self.adj_list[current_vertex]:
+                distance = current_distance + weight
+                if distance < distances[neighbor]:
+                    distances[neighbor] = distance
+                    previous[neighbor] = current_vertex
+                    queue.push(neighbor, distance)   # вставка або зменшення ключа
+
+        return distances, previous
+
+    def update_shortest_paths(self, distances, previous, new_edges, bidirectional=True):
+        """Оновлює результат dijkstra після додавання ребер (або зменшення ваг)
+        без повного перерахунку.
+
+        distances, previous - словники, повернуті dijkstra (змінюються на місці);
+        new_edges - ребра (u, v, weight), вже додані через add_edge
+        з тим самим bidirectional. Нове ребро може лише скоротити відстані, тому
+        Дейкстра запускається тільки з вершин, до яких шлях покращився, і
+        обробляє лише ту частину графа, де відстані справді змінились.
+        """
+        heap = []
+        for u, v, weight in new_edges:
+            # Нові вершини з'являються лише як кінці нових ребер
+            for vertex in (u, v):
+                if vertex not in distances:
+                    distances[vertex] = float("inf")
+                    previous[vertex] = None
+            for a, b in ((u, v), (v, u)) if bidirectional else ((u, v),):
+                distance = distances[a] + weight
+                if distance < distances[b]:
+                    distances[b] = distance
+                    previous[b] = a
+                    heapq.heappush(heap, (distance, b))
+
+        while heap:
+            current_distance, current_vertex = heapq.heappop(heap)
+            if current_distance > distances[current_vertex]:
+                continue
+            for neighbor, weight in self.adj_list[current_vertex]:
+                distance = current_distance + weight
+                if distance < distances[neighbor]:
+                    distances[neighbor] = distance
+                    previous[neighbor] = current_vertex
+                    heapq.heappush(heap, (distance, neighbor))
+
+        return distances, previous
+
     def get_shortest_path(self, previous, start, target):
         """Відновлення найкоротшого шляху з start до target
         на основі словника previous.
@@ -74,65 +203,819 @@ class Graph:
 
         return path
 
+    def shortest_path(self, start, target, bidirectional=False):
+        """Найкоротший шлях між двома вершинами.
+        На відміну від dijkstra, пошук зупиняється, щойно target остаточно оброблено.
+        bidirectional=True - пошук одночасно від start і від target (назустріч).
+        Повертає (відстань, шлях) або (inf, None), якщо шляху немає.
+        """
+        if start not in self.adj_list or target not in self.adj_list:
+            return float("inf"), None
+        if bidirectional:
+            return self._bidirectional_search(start, target)
+
+        distances = {start: 0}
+        previous = {start: None}
+        heap = [(0, start)]
+
+        while heap:
+            current_distance, current_vertex = heapq.heappop(heap)
+            if current_distance > distances[current_vertex]:
+                continue
+            # Ціль обробляється з остаточною відстанню - далі шукати немає сенсу
+            if current_vertex == target:
+                return current_distance, self.get_shortest_path(previous, start, target)
+
+            for neighbor, weight in self.adj_list[current_vertex]:
+                distance = current_distance + weight
+                if distance < distances.get(neighbor, float("inf")):
+                    distances[neighbor] = distance
+                    previous[neighbor] = current_vertex
+                    heapq.heappush(heap, (distance, neighbor))
+
+        return float("inf"), None
+
+    def astar(self, start, target, heuristic=None, stats=None):
+        """Алгоритм A*: Дейкстра, що першими розглядає вершини з меншим g + h.
+        heuristic(vertex, target) - нижня оцінка відстані від vertex до target
+        (наприклад, Landmarks або euclidean_heuristic). Без неї A* збігається з Дейкстрою.
+        Для допустимої та узгодженої евристики результат точний.
+        stats - словник; якщо передано, stats["settled"] - скільки вершин забрано з черги
+        й розглянуто (без застарілих записів), тобто обсяг роботи пошуку.
+        Повертає (відстань, шлях) або (inf, None), якщо шляху немає.
+        """
+        if stats is not None:
+            stats["settled"] = 0
+        if start not in self.adj_list or target not in self.adj_list:
+            return float("inf"), None
+        if heuristic is None:
+            heuristic = _zero_heuristic
+
+        distances = {start: 0}
+        previous = {start: None}
+        # Пріоритетна черга: (відстань + оцінка, відстань, вершина)
+        heap = [(heuristic(start, target), 0, start)]
+
+        while heap:
+            _, current_distance, current_vertex = heapq.heappop(heap)
+            if current_distance > distances[current_vertex]:
+                continue
+            if stats is not None:
+                stats["settled"] += 1
+            if current_vertex == target:
+                return current_distance, self.get_shortest_path(previous, start, target)
+
+            for neighbor, weight in self.adj_list[current_vertex]:
+                distance = current_distance + weight
+                if distance < distances.get(neighbor, float("inf")):
+                    distances[neighbor] = distance
+                    previous[neighbor] = current_vertex
+                    estimate = distance + heuristic(neighbor, target)
+                    heapq.heappush(heap, (estimate, distance, neighbor))
+
+        return float("inf"), None
+
+    def _reverse_adj_list(self):
+        """Списки вхідних ребер: вершина -> список (попередник, вага)."""
+        if self._reverse_adj is None:
+            reverse = {vertex: [] for vertex in self.adj_list}
+            for u, neighbors in self.adj_list.items():
+                for v, weight in neighbors:
+                    reverse[v].append((u, weight))
+            self._reverse_adj = reverse
+        return self._reverse_adj
+
+    def _bidirectional_search(self, start, target):
+        """Двонаправлена Дейкстра: прямий пошук від start і зворотний від target.
+        Зупиняється, коли сума мінімумів обох куп не менша за найкращий знайдений шлях.
+        """
+        if start == target:
+            return 0, [start]
+
+        adjacency = (self.adj_list, self._reverse_adj_list())
+        distances = ({start: 0}, {target: 0})
+        previous = ({start: None}, {target: None})
+        heaps = ([(0, start)], [(0, target)])
+
+        best = float("inf")
+        meeting = None
+
+        while heaps[0] and heaps[1]:
+            if heaps[0][0][0] + heaps[1][0][0] >= best:
+                break
+
+            # Розширюємо той напрямок, у якого менша поточна відстань
+            side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+            dist = distances[side]
+            other = distances[1 - side]
+
+            current_distance, current_vertex = heapq.heappop(heaps[side])
+            if current_distance > dist[current_vertex]:
+                continue
+
+            for neighbor, weight in adjacency[side][current_vertex]:
+                distance = current_distance + weight
+                if distance < dist.get(neighbor, float("inf")):
+                    dist[neighbor] = distance
+                    previous[side][neighbor] = current_vertex
+                    heapq.heappush(heaps[side], (distance, neighbor))
+                # Вершину вже досяг пошук з іншого боку - маємо кандидата на шлях
+                if neighbor in other and dist[neighbor] + other[neighbor] < best:
+                    best = dist[neighbor] + other[neighbor]
+                    meeting = neighbor
+
+        if meeting is None:
+            return float("inf"), None
+
+        # Шлях start -> meeting за прямими попередниками, далі meeting -> target за зворотними
+        path = self.get_shortest_path(previous[0], start, meeting)
+        current = previous[1][meeting]
+        while current is not None:
+            path.append(current)
+            current = previous[1][current]
+
+        return best, path
+
+    def many_to_many(self, sources, targets=None, max_workers=None, out=None):
+        """Паралельна матриця відстаней (див. CSRGraph.many_to_many)."""
+        return self.freeze().many_to_many(sources, targets, max_workers=max_workers, out=out)
+
+    def all_pairs(self, max_workers=None, out=None):
+        """Паралельна матриця відстаней між усіма вершинами в порядку adj_list."""
+        return self.freeze().all_pairs(max_workers=max_workers, out=out)
+
+    def freeze(self):
+        """Перетворює граф у компактне незмінне CSR-представлення (CSRGraph)."""
+        return CSRGraph.from_adj_list(self.adj_list)
+
+
+class IndexedDaryHeap:
+    """D-арна мін-купа з індексом позицій: push(item, priority) вставляє елемент
+    або зменшує його пріоритет за O(log_d n), pop() повертає (пріоритет, елемент).
+    Більше d - нижча купа й дешевше зменшення ключа, але дорожчий pop.
+    """
+
+    def __init__(self, d=4):
+        self.d = d
+        self._items = []
+        self._priority = {}
+        self._position = {}
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, item):
+        return item in self._position
+
+    def push(self, item, priority):
+        if item in self._position:
+            if priority < self._priority[item]:
+                self._priority[item] = priority
+                self._sift_up(self._position[item])
+            return
+        self._items.append(item)
+        self._priority[item] = priority
+        self._position[item] = len(self._items) - 1
+        self._sift_up(len(self._items) - 1)
+
+    def pop(self):
+        items = self._items
+        top = items[0]
+        last = items.pop()
+        if items:
+            items[0] = last
+            self._position[last] = 0
+            self._sift_down(0)
+        del self._position[top]
+        return self._priority.pop(top), top
+
+    def _sift_up(self, index):
+        items, priority, position, d = self._items, self._priority, self._position, self.d
+        item = items[index]
+        key = priority[item]
+        while index > 0:
+            parent = (index - 1) // d
+            if priority[items[parent]] <= key:
+                break
+            items[index] = items[parent]
+            position[items[index]] = index
+            index = parent
+        items[index] = item
+        position[item] = index
+
+    def _sift_down(self, index):
+        items, priority, position, d = self._items, self._priority, self._position, self.d
+        size = len(items)
+        item = items[index]
+        key = priority[item]
+        while True:
+            first = d * index + 1
+            if first >= size:
+                break
+            # Найменший з до d нащадків
+            best = first
+            best_key = priority[items[first]]
+            for child in range(first + 1, min(first + d, size)):
+                child_key = priority[items[child]]
+                if child_key < best_key:
+                    best, best_key = child, child_key
+            if best_key >= key:
+                break
+            items[index] = items[best]
+            position[items[index]] = index
+            index = best
+        items[index] = item
+        position[item] = index
+
+
+class BucketQueue:
+    """Черга Діала для невід'ємних цілих пріоритетів, що видаються монотонно
+    (як відстані в Дейкстрі): кошик на кожне значення відстані й курсор,
+    що рухається лише вперед. push і зменшення ключа - O(1), pop - O(1)
+    амортизовано плюс прохід курсора до максимальної відстані.
+    """
+
+    def __init__(self):
+        self._buckets = {}      # відстань -> множина елементів
+        self._priority = {}
+        self._cursor = 0
+
+    def __len__(self):
+        return len(self._priority)
+
+    def __contains__(self, item):
+        return item in self._priority
+
+    def push(self, item, priority):
+        # Курсор перебирає кошики по одиниці - дробовий пріоритет він ніколи не знайде
+        if not (priority >= 0 and float(priority).is_integer()):
+            raise ValueError(f"BucketQueue приймає лише невід'ємні цілі пріоритети, отримано {priority!r}")
+        old = self._priority.get(item)
+        if old is not None:
+            if priority >= old:
+                return
+            bucket = self._buckets[old]
+            bucket.discard(item)
+            if not bucket:
+                del self._buckets[old]
+        self._priority[item] = priority
+        self._buckets.setdefault(priority, set()).add(item)
+        if priority < self._cursor:
+            self._cursor = priority
+
+    def pop(self):
+        if not self._priority:
+            raise IndexError("pop from empty BucketQueue")
+        while self._cursor not in self._buckets:
+            self._cursor += 1
+        bucket = self._buckets[self._cursor]
+        item = bucket.pop()
+        if not bucket:
+            del self._buckets[self._cursor]
+        return self._priority.pop(item), item
+
+
+def _zero_heuristic(vertex, target):
+    return 0
+
+
+def euclidean_heuristic(coordinates, scale=1.0):
+    """Евристика для A* за координатами вершин: scale * евклідова відстань.
+    scale - мінімальна вага ребра на одиницю довжини, щоб оцінка не перевищувала реальну.
+    """
+    def heuristic(vertex, target):
+        (x1, y1), (x2, y2) = coordinates[vertex], coordinates[target]
+        return scale * ((x1 - x2) ** 2 + (y1 - y2) ** 2) ** 0.5
+    return heuristic
+
+
+class Landmarks:
+    """Евристика ALT (A*, Landmarks, Triangle inequality) для повторюваних запитів.
+
+    Для кількох опорних вершин L заздалегідь обчислюються відстані d(L, v) та d(v, L).
+    З нерівності трикутника d(v, t) >= max(d(L, t) - d(L, v), d(v, L) - d(t, L)),
+    тому максимум по всіх L - допустима й узгоджена оцінка для A*.
+    Таблиці можна зберегти на диск (save) і завантажити (load) без повторного обчислення.
+    """
+
+    def __init__(self, names, landmarks, from_landmark, to_landmark):
+        self.names = list(names)
+        self.ids = {name: i for i, name in enumerate(self.names)}
+        self.landmarks = list(landmarks)
+        # Рядок i - відстані для вершини з id i до/від кожного орієнтира
+        self.from_landmark = from_landmark   # (n, k): d(L, v)
+        self.to_landmark = to_landmark       # (n, k): d(v, L)
+        self._target = None
+        self._target_rows = None
+
+    @classmethod
+    def build(cls, graph, count=8, seed=None):
+        """Обирає count орієнтирів методом найвіддаленішої точки й рахує їхні таблиці."""
+        names = list(graph.adj_list)
+        reverse = Graph()
+        reverse.adj_list = graph._reverse_adj_list()
+        rng = np.random.default_rng(seed)
+
+        landmarks = []
+        from_columns = []
+        to_columns = []
+        # Найменша відстань від кожної вершини до вже обраних орієнтирів
+        nearest = np.full(len(names), np.inf)
+        candidate = names[rng.integers(len(names))]
+
+        for _ in range(min(count, len(names))):
+            landmarks.append(candidate)
+            forward, _ = graph.dijkstra(candidate)
+            backward, _ = reverse.dijkstra(candidate)
+            from_columns.append([forward[name] for name in names])
+            to_columns.append([backward[name] for name in names])
+
+            reach = np.array(from_columns[-1])
+            nearest = np.minimum(nearest, reach)
+            # Наступний орієнтир - найвіддаленіша досяжна вершина
+            finite = np.where(np.isfinite(nearest), nearest, -1)
+            candidate = names[int(np.argmax(finite))]
+
+        return cls(names, landmarks,
+                   np.array(from_columns).T.copy(), np.array(to_columns).T.copy())
+
+    @staticmethod
+    def _npz_path(path):
+        # np.savez сам дописує .npz - load має шукати той самий файл
+        path = os.fspath(path)
+        return path if path.endswith(".npz") else path + ".npz"
+
+    def save(self, path):
+        np.savez(self._npz_path(path), names=_encode_names(self.names),
+                 landmarks=_encode_names(self.landmarks),
+                 from_landmark=self.from_landmark, to_landmark=self.to_landmark)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(cls._npz_path(path)) as data:
+            return cls(_decode_names(data["names"]), _decode_names(data["landmarks"]),
+                       data["from_landmark"], data["to_landmark"])
+
+    def __call__(self, vertex, target):
+        """Нижня оцінка d(vertex, target) - використовується як heuristic в Graph.astar."""
+        if target != self._target:
+            t = self.ids[target]
+            self._target = target
+            self._target_rows = (self.from_landmark[t], self.to_landmark[t])
+        from_target, to_target = self._target_rows
+        v = self.ids[vertex]
+
+        with np.errstate(invalid="ignore"):
+            bound = np.fmax(np.fmax.reduce(from_target - self.from_landmark[v]),
+                            np.fmax.reduce(self.to_landmark[v] - to_target))
+        # NaN (обидві відстані нескінченні) нічого не говорить про вершину
+        return float(bound) if bound > 0 else 0
+
+
+def _weight_array(weights):
+    """Ваги ребер як масив: цілі лишаються int64 (щоб відстані збігались з Graph.dijkstra),
+    решта - float64."""
+    weights = np.asarray(weights)
+    if weights.dtype.kind in "iub":
+        return weights.astype(np.int64, copy=False)
+    return weights.astype(np.float64, copy=False)
+
+
+def _names_to_tuples(value):
+    # JSON повертає кортежі як списки; імена вершин мають бути хешованими
+    if isinstance(value, list):
+        return tuple(_names_to_tuples(item) for item in value)
+    return value
+
+
+def _encode_names(names):
+    """Імена вершин -> масив NumPy, який зберігається без pickle.
+    Лише цілі або лише рядки - звичайний одновимірний масив; інше (кортежі, змішані типи) -
+    0-вимірний рядок JSON, бо np.array з кортежів дає двовимірний масив.
+    """
+    kinds = {type(name) for name in names}
+    if kinds <= {int} or kinds == {str}:
+        return np.array(names, dtype=np.int64 if kinds <= {int} else None)
+    return np.array(json.dumps(names))
+
+
+def _decode_names(array):
+    if array.ndim == 0:
+        return [_names_to_tuples(name) for name in json.loads(array.item())]
+    return array.tolist()
+
+
+class CSRGraph:
+    """Граф у форматі CSR (compressed sparse row).
+
+    Вершини пронумеровані 0..n-1 (names[id] -> ім'я, ids[ім'я] -> id).
+    Сусіди вершини u - це targets[offsets[u]:offsets[u + 1]]
+    з вагами weights[offsets[u]:offsets[u + 1]]. Замість списків кортежів -
+    три суцільні масиви NumPy, що значно економить пам'ять на великих графах.
+    """
+
+    def __init__(self, names, offsets, targets, weights):
+        self.names = list(names)
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+
+    @cached_property
+    def ids(self):
+        # будується при першому зверненні, щоб не сповільнювати завантаження
+        return {name: i for i, name in enumerate(self.names)}
+
+    @classmethod
+    def from_edges(cls, sources, targets, weights, names, directed=False):
+        """Будує CSR з масивів ребер (id вершин 0..len(names)-1) векторно, без циклів Python.
+        directed=False - кожне ребро додається в обох напрямках.
+        """
+        sources = np.asarray(sources, dtype=np.int64)
+        targets = np.asarray(targets, dtype=np.int64)
+        weights = _weight_array(weights)
+        if not directed:
+            sources, targets = (np.concatenate((sources, targets)),
+                                np.concatenate((targets, sources)))
+            weights = np.concatenate((weights, weights))
+
+        n = len(names)
+        order = np.argsort(sources, kind="stable")
+        offsets = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=n), out=offsets[1:])
+        index_dtype = np.int32 if n < 2**31 else np.int64
+        return cls(names, offsets, targets[order].astype(index_dtype), weights[order])
+
+    def save(self, directory):
+        """Бінарний знімок графа: окремі .npy-файли, які load відкриває через memmap."""
+        os.makedirs(directory, exist_ok=True)
+        for field in ("offsets", "targets", "weights"):
+            np.save(os.path.join(directory, field + ".npy"), getattr(self, field))
+        np.save(os.path.join(directory, "names.npy"), _encode_names(self.names))
+
+    @classmethod
+    def load(cls, directory, mmap=True):
+        """Завантажує знімок, збережений save. З mmap=True масиви не читаються
+        в пам'ять цілком - сторінки підтягуються з диска за потреби.
+        """
+        mode = "r" if mmap else None
+        arrays = {field: np.load(os.path.join(directory, field + ".npy"), mmap_mode=mode)
+                  for field in ("offsets", "targets", "weights")}
+        names = _decode_names(np.load(os.path.join(directory, "names.npy")))
+        return cls(names, arrays["offsets"], arrays["targets"], arrays["weights"])
+
+    @classmethod
+    def from_adj_list(cls, adj_list):
+        names = list(adj_list)
+        ids = {name: i for i, name in enumerate(names)}
+
+        degrees = np.fromiter((len(adj_list[name]) for name in names), dtype=np.int64,
+                              count=len(names))
+        offsets = np.zeros(len(names) + 1, dtype=np.int64)
+        np.cumsum(degrees, out=offsets[1:])
+
+        edge_count = int(offsets[-1])
+        targets = np.fromiter((ids[v] for name in names for v, _ in adj_list[name]),
+                              dtype=np.int32 if len(names) < 2**31 else np.int64,
+                              count=edge_count)
+        weights = _weight_array([w for name in names for _, w in adj_list[name]])
+        return cls(names, offsets, targets, weights)
+
+    @property
+    def num_vertices(self):
+        return len(self.offsets) - 1
+
+    @property
+    def num_edges(self):
+        return int(self.offsets[-1])
+
+    def neighbors(self, u):
+        """Сусіди вершини з id u: (масив id сусідів, масив ваг)."""
+        start, end = self.offsets[u], self.offsets[u + 1]
+        return self.targets[start:end], self.weights[start:end]
+
+    def dijkstra_ids(self, start_id):
+        """Алгоритм Дейкстри на цілих id.
+        Повертає масиви distances (float64, inf - недосяжні) та previous (-1 - немає попередника).
+        """
+        distances, previous = self._dijkstra_lists(start_id)
+        return np.array(distances, dtype=np.float64), np.array(previous, dtype=np.int64)
+
+    def _dijkstra_lists(self, start_id):
+        """Дейкстра зі списками Python: відстані лишаються того ж типу, що й ваги (int чи float)."""
+        n = self.num_vertices
+        offsets = self.offsets
+        targets = self.targets
+        weights = self.weights
+
+        distances = [float("inf")] * n
+        previous = [-1] * n
+        distances[start_id] = 0
+        heap = [(0, start_id)]
+
+        while heap:
+            current_distance, u = heapq.heappop(heap)
+            if current_distance > distances[u]:
+                continue
+
+            start, end = offsets[u], offsets[u + 1]
+            # Зріз сусідів переводимо в списки Python одним викликом - це швидше,
+            # ніж читати елементи масивів NumPy по одному
+            for v, weight in zip(targets[start:end].tolist(), weights[start:end].tolist()):
+                distance = current_distance + weight
+                if distance < distances[v]:
+                    distances[v] = distance
+                    previous[v] = u
+                    heapq.heappush(heap, (distance, v))
+
+        return distances, previous
+
+    def dijkstra(self, start):
+        """Те саме, що Graph.dijkstra: словники distances і previous за іменами вершин."""
+        dist_ids, prev_ids = self._dijkstra_lists(self.ids[start])
+        names = self.names
+        distances = dict(zip(names, dist_ids))
+        previous = {name: (names[p] if p >= 0 else None)
+                    for name, p in zip(names, prev_ids)}
+        return distances, previous
+
+    get_shortest_path = Graph.get_shortest_path
+
+    def many_to_many(self, sources, targets=None, max_workers=None, out=None, chunk_size=16):
+        """Матриця відстаней sources x targets (targets=None - усі вершини).
 
-def visualize_graph(graph: Graph, shortest_path=None):
+        Джерела розподіляються між процесами пулу порціями по chunk_size;
+        масиви графа передаються процесам один раз через спільну пам'ять.
+        out - шлях до .npy: матриця записується у файл через memmap порціями рядків,
+        тож вона може бути більшою за оперативну пам'ять. Без out - звичайний масив NumPy.
+        Рядок i відповідає sources[i], стовпець j - targets[j]; inf - шляху немає.
+        """
+        source_ids = np.array([self.ids[s] for s in sources], dtype=np.int64)
+        if targets is None:
+            target_ids = None
+            columns = self.num_vertices
+        else:
+            target_ids = np.array([self.ids[t] for t in targets], dtype=np.int64)
+            columns = len(target_ids)
+
+        shape = (len(source_ids), columns)
+        if out is None:
+            matrix = np.empty(shape)
+        else:
+            matrix = np.lib.format.open_memmap(out, mode="w+", dtype=np.float64, shape=shape)
+
+        blocks = []
+        spec = {}
+        try:
+            for field in ("offsets", "targets", "weights"):
+                array = getattr(self, field)
+                block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+                np.ndarray(array.shape, array.dtype, buffer=block.buf)[:] = array
+                blocks.append(block)
+                spec[field] = (block.name, array.shape, array.dtype.str)
+
+            with ProcessPoolExecutor(max_workers=max_workers, initializer=_attach_shared_graph,
+                                     initargs=(spec,)) as executor:
+                starts = range(0, len(source_ids), chunk_size)
+                chunks = (source_ids[i:i + chunk_size] for i in starts)
+                rows = executor.map(_distance_rows, chunks, [target_ids] * len(starts))
+                # Порції рядків записуються в міру готовності, по порядку
+                for start, block_rows in zip(starts, rows):
+                    matrix[start:start + len(block_rows)] = block_rows
+        finally:
+            for block in blocks:
+                block.close()
+                block.unlink()
+
+        if out is not None:
+            matrix.flush()
+        return matrix
+
+    def all_pairs(self, max_workers=None, out=None, chunk_size=16):
+        """Повна матриця відстаней n x n у порядку вершин self.names."""
+        return self.many_to_many(self.names, None, max_workers=max_workers,
+                                 out=out, chunk_size=chunk_size)
+
+
+def _read_edge_chunks(path, parse_lines, chunk_size):
+    """Читає файл порціями по chunk_size рядків і розбирає кожну порцію векторно."""
+    with open(path) as file:
+        while True:
+            lines = list(itertools.islice(file, chunk_size))
+            if not lines:
+                break
+            chunk = parse_lines(lines)
+            if chunk is not None:
+                yield chunk
+
+
+def _build_from_chunks(chunks, directed, vertex_dtype):
+    """Збирає порції (u, v, w) в CSRGraph; імена вершин стискаються в id через np.unique."""
+    us, vs, ws = [], [], []
+    for u, v, w in chunks:
+        us.append(u)
+        vs.append(v)
+        ws.append(w)
+    if not us:
+        return CSRGraph([], np.zeros(1, dtype=np.int64), np.zeros(0, dtype=np.int32),
+                        np.zeros(0))
+
+    u = np.concatenate(us).astype(vertex_dtype)
+    v = np.concatenate(vs).astype(vertex_dtype)
+    names, ids = np.unique(np.concatenate((u, v)), return_inverse=True)
+    ids = ids.ravel()
+    return CSRGraph.from_edges(ids[:len(u)], ids[len(u):], np.concatenate(ws),
+                               names.tolist(), directed=directed)
+
+
+def load_edge_list(path, delimiter=None, directed=False, vertex_dtype=np.int64,
+                   comments="#", chunk_size=1_000_000):
+    """
+    Завантажує граф з CSV/TSV-файлу рядків "u v weight" одразу в CSRGraph.
+    delimiter – None для пробілів/табуляцій, "," для CSV
+    vertex_dtype – тип імен вершин (np.int64 або str для текстових імен довільної довжини)
+    Файл читається порціями по chunk_size рядків, кожна розбирається np.loadtxt.
+    Цілі ваги лишаються цілими (як у Graph.freeze), інакше - float64.
+    """
+    # Ваги спершу розбираються як цілі; перша порція з дробовими перемикає на float64
+    weight_dtype = [np.int64]
+
+    def parse_text(lines):
+        # dtype=str: ширина рядків визначається за даними, тож імена не обрізаються.
+        # NumPy читає такі дані внутрішніми блоками й попереджає про рядки-коментарі
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore", message="Input line", category=UserWarning)
+            data = np.loadtxt(lines, dtype=str, delimiter=delimiter, comments=comments,
+                              usecols=(0, 1, 2), ndmin=2)
+        if data.size == 0:
+            return None
+        try:
+            weights = data[:, 2].astype(np.int64)
+        except ValueError:
+            weights = data[:, 2].astype(np.float64)
+        return data[:, 0], data[:, 1], weights
+
+    def parse(lines):
+        while True:
+            dtype = [("u", vertex_dtype), ("v", vertex_dtype), ("w", weight_dtype[0])]
+            try:
+                data = np.loadtxt(lines, dtype=dtype, delimiter=delimiter, comments=comments,
+                                  usecols=(0, 1, 2), ndmin=1)
+                break
+            except ValueError:
+                if weight_dtype[0] is np.float64:
+                    raise
+                weight_dtype[0] = np.float64
+        if data.size == 0:
+            return None
+        return data["u"], data["v"], data["w"]
+
+    parser = parse_text if vertex_dtype is str else parse
+    return _build_from_chunks(_read_edge_chunks(path, parser, chunk_size), directed, vertex_dtype)
+
+
+def load_dimacs(path, chunk_size=1_000_000):
+    """Завантажує орієнтований граф у форматі DIMACS (рядки "a u v weight") в CSRGraph."""
+    def parse(lines):
+        arcs = [line[1:] for line in lines if line.startswith("a")]
+        if not arcs:
+            return None
+        data = np.loadtxt(arcs, dtype=np.int64, ndmin=2)
+        return data[:, 0], data[:, 1], data[:, 2]
+
+    return _build_from_chunks(_read_edge_chunks(path, parse, chunk_size), True, np.int64)
+
+
+# Граф у спільній пам'яті для процесів many_to_many (по одному на процес)
+_shared_graph = None
+_shared_blocks = []
+
+
+def _attach_shared_graph(spec):
+    """Ініціалізатор процесу: підключається до масивів графа у спільній пам'яті."""
+    global _shared_graph
+    arrays = {}
+    for field, (name, shape, dtype) in spec.items():
+        block = shared_memory.SharedMemory(name=name)
+        _shared_blocks.append(block)   # тримаємо посилання, поки процес живий
+        arrays[field] = np.ndarray(shape, np.dtype(dtype), buffer=block.buf)
+    _shared_graph = CSRGraph((), arrays["offsets"], arrays["targets"], arrays["weights"])
+
+
+def _distance_rows(source_ids, target_ids):
+    """Виконується в процесі пулу: рядки матриці відстаней для порції джерел."""
+    rows = np.empty((len(source_ids),
+                     _shared_graph.num_vertices if target_ids is None else len(target_ids)))
+    for i, source in enumerate(source_ids):
+        distances, _ = _shared_graph.dijkstra_ids(int(source))
+        rows[i] = distances if target_ids is None else distances[target_ids]
+    return rows
+
+
+def graph_layout(graph: Graph, positions=None, seed=42):
+    """
+    Координати вершин для візуалізації, кешовані в графі між викликами.
+    positions – готові координати {вершина: (x, y)} (наприклад, з файлу чи GPS);
+    інакше використовується spring_layout, який перераховується лише тоді,
+    коли з'явились нові вершини (старі координати - початкове наближення).
+    """
+    if positions is not None:
+        graph._layout = dict(positions)
+        return graph._layout
+
+    cached = graph._layout
+    if cached is not None and all(vertex in cached for vertex in graph.adj_list):
+        return cached
+
+    G = nx.Graph()
+    G.add_nodes_from(graph.adj_list)
+    G.add_edges_from((u, v) for u, neighbors in graph.adj_list.items() for v, _ in neighbors)
+    initial = {v: p for v, p in cached.items() if v in G} if cached else None
+    graph._layout = nx.spring_layout(G, pos=initial or None, seed=seed)
+    return graph._layout
+
+
+class GraphView:
+    """
+    Швидка візуалізація великих графів без networkx-малювання:
+    - усі ребра - один LineCollection, вершини - один scatter;
+    - підписи вершин лише для невеликих графів, підписи ваг - не більше
+      max_edge_labels (рівномірна вибірка), 0 - без підписів;
+    - highlight_path змінює лише окремий шар шляху, а не перебудовує фігуру.
+    """
+
+    def __init__(self, graph: Graph, positions=None, ax=None,
+                 max_node_labels=100, max_edge_labels=100, node_size=None):
+        self.graph = graph
+        self.positions = graph_layout(graph, positions)
+
+        names = list(graph.adj_list)
+        index = {name: i for i, name in enumerate(names)}
+        coords = np.array([self.positions[name] for name in names], dtype=float).reshape(-1, 2)
+
+        # Неорієнтовані унікальні ребра (u, v) та їхні ваги
+        weights = {}
+        for u, neighbors in graph.adj_list.items():
+            for v, w in neighbors:
+                a, b = index[u], index[v]
+                weights[(a, b) if a <= b else (b, a)] = w
+        edges = np.array(list(weights), dtype=np.int64).reshape(-1, 2)
+        segments = coords[edges]
+
+        if ax is None:
+            _, ax = plt.subplots(figsize=(8, 6))
+        self.ax = ax
+        self.figure = ax.figure
+
+        small = len(names) <= max_node_labels
+        if node_size is None:
+            node_size = 1500 if small else max(1, 30000 / len(names))
+
+        self.edge_collection = LineCollection(segments, colors="gray",
+                                              linewidths=1 if small else 0.5, zorder=1)
+        self.path_collection = LineCollection([], colors="red", linewidths=2.5, zorder=2)
+        ax.add_collection(self.edge_collection)
+        ax.add_collection(self.path_collection)
+        ax.scatter(coords[:, 0], coords[:, 1], s=node_size, c="skyblue", zorder=3)
+
+        if small:
+            for name, (x, y) in zip(names, coords):
+                ax.text(x, y, str(name), fontsize=12, fontweight="bold",
+                        ha="center", va="center", zorder=4)
+
+        if max_edge_labels and len(edges):
+            step = -(-len(edges) // max_edge_labels)   # ділення з округленням угору
+            middles = segments[::step].mean(axis=1)
+            for (x, y), w in zip(middles, list(weights.values())[::step]):
+                ax.text(x, y, str(w), fontsize=10, ha="center", va="center", zorder=4,
+                        bbox=dict(boxstyle="round", ec="white", fc="white"))
+
+        ax.margins(0.08)   # щоб великі кружки вершин не обрізались по краях
+        ax.autoscale_view()
+        ax.axis("off")
+
+    def highlight_path(self, path):
+        """Підсвічує шлях (список вершин) червоним; None або [] - прибирає підсвічування."""
+        pos = self.positions
+        segments = [(pos[a], pos[b]) for a, b in zip(path, path[1:])] if path else []
+        self.path_collection.set_segments(segments)
+        self.figure.canvas.draw_idle()
+
+
+def visualize_graph(graph: Graph, shortest_path=None, positions=None):
     """
     Візуалізація графа:
     - вузли: вершини
     - підписи на ребрах: ваги
     - найкоротший шлях (якщо заданий) підсвічується іншим кольором
+    positions – збережені координати вершин (інакше spring_layout із кешем)
     """
-    G = nx.Graph()
+    view = GraphView(graph, positions=positions)
+    view.highlight_path(shortest_path)
 
-    # Додаємо ребра в networkx-граф
-    for u, neighbors in graph.adj_list.items():
-        for v, w in neighbors:
-            # networkx сам ігнорує дублікати ребер, якщо вага однакова
-            G.add_edge(u, v, weight=w)
-
-    pos = nx.spring_layout(G, seed=42)  # красиве розташування вершин
-
-    plt.figure(figsize=(8, 6))
-
-    # Ребра та ваги
-    edges = G.edges()
-    weights = nx.get_edge_attributes(G, "weight")
-
-    # Якщо є найкоротший шлях — виділимо ребра на ньому
-    edge_colors = []
-    edge_widths = []
-
-    path_edges = set()
-    if shortest_path and len(shortest_path) > 1:
-        for i in range(len(shortest_path) - 1):
-            a = shortest_path[i]
-            b = shortest_path[i + 1]
-            # робимо неорієнтовану пару
-            path_edges.add((a, b))
-            path_edges.add((b, a))
-
-    for (u, v) in edges:
-        if (u, v) in path_edges:
-            edge_colors.append("red")
-            edge_widths.append(2.5)
-        else:
-            edge_colors.append("gray")
-            edge_widths.append(1)
-
-    # Малюємо вершини
-    nx.draw_networkx_nodes(G, pos, node_size=1500, node_color="skyblue")
-    # Малюємо ребра
-    nx.draw_networkx_edges(G, pos, edgelist=edges, edge_color=edge_colors, width=edge_widths)
-    # Підписи вершин
-    nx.draw_networkx_labels(G, pos, font_size=12, font_weight="bold")
-    # Підписи ваг ребер
-    nx.draw_networkx_edge_labels(G, pos, edge_labels=weights, font_size=10)
-
-    plt.axis("off")
     plt.title("Граф та найкоротший шлях (алгоритм Дейкстри)")
     plt.tight_layout()
     plt.show()
-
+    return view
 
 
 if __name__ == "__main__":
@@ -2,6 +2,8 @@ import uuid
 import heapq
 import networkx as nx
 import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.collections import LineCollection
 
 
 class Node:
@@ -12,20 +14,24 @@ class Node:
         self.color = color
         self.id = str(uuid.uuid4())  # Унікальний ідентифікатор для кожного вузла
 
-# Рекурсивна функція для додавання ребер до графа
+# Функція для додавання ребер до графа (без рекурсії - зі стеком,
+# тож глибокі дерева не впираються в ліміт рекурсії)
 def add_edges(graph, node, pos, x=0, y=0, layer=1):
-    if node is not None:
+    stack = [(node, x, y, layer)] if node is not None else []
+    while stack:
+        node, x, y, layer = stack.pop()
         graph.add_node(node.id, color=node.color, label=node.val)
-        if node.left:
-            graph.add_edge(node.id, node.left.id)
-            l = x - 1 / 2 ** layer
-            pos[node.left.id] = (l, y - 1)
-            add_edges(graph, node.left, pos, x=l, y=y - 1, layer=layer + 1)
+        shift = 0.5 ** layer   # те саме, що 1 / 2 ** layer, але без великих цілих
         if node.right:
             graph.add_edge(node.id, node.right.id)
-            r = x + 1 / 2 ** layer
+            r = x + shift
             pos[node.right.id] = (r, y - 1)
-            add_edges(graph, node.right, pos, x=r, y=y - 1, layer=layer + 1)
+            stack.append((node.right, r, y - 1, layer + 1))
+        if node.left:
+            graph.add_edge(node.id, node.left.id)
+            l = x - shift
+            pos[node.left.id] = (l, y - 1)
+            stack.append((node.left, l, y - 1, layer + 1))
     return graph
 
 # Візуалізація бінарного дерева
@@ -66,16 +72,346 @@ def build_heap_tree(heap_list):
     return nodes[0]  # корінь дерева
 
 
-def draw_heap(heap_list):
+class DaryHeap:
+    """
+    Мін-купа на масиві, де кожен вузол має d нащадків (нащадки i - це d*i+1 ... d*i+d).
+    Більше d - нижча купа й швидший push, але pop порівнює більше нащадків.
+    Підтримує ітерацію в порядку масиву, тож draw_heap малює її напряму.
+    """
+
+    def __init__(self, iterable=(), d=2):
+        if d < 2:
+            raise ValueError("d має бути не менше 2")
+        self.d = d
+        self._data = []
+        self.heapify(iterable)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def heapify(self, iterable):
+        """Замінює вміст купи елементами iterable за O(n) (знизу вгору)."""
+        self._data = list(iterable)
+        for index in reversed(range((len(self._data) - 2) // self.d + 1)):
+            self._sift_down(index)
+
+    def push(self, item):
+        self._data.append(item)
+        self._sift_up(len(self._data) - 1)
+
+    def peek(self):
+        if not self._data:
+            raise IndexError("peek з порожньої купи")
+        return self._data[0]
+
+    def pop(self):
+        if not self._data:
+            raise IndexError("pop з порожньої купи")
+        last = self._data.pop()
+        if not self._data:
+            return last
+        top = self._data[0]
+        self._data[0] = last
+        self._sift_down(0)
+        return top
+
+    def pushpop(self, item):
+        """push, а потім pop - але за один прохід (як heapq.heappushpop)."""
+        if self._data and self._data[0] < item:
+            item, self._data[0] = self._data[0], item
+            self._sift_down(0)
+        return item
+
+    def replace(self, item):
+        """pop, а потім push - за один прохід (як heapq.heapreplace)."""
+        top = self.peek()
+        self._data[0] = item
+        self._sift_down(0)
+        return top
+
+    def meld(self, other):
+        """Забирає всі елементи other (він спорожнюється) і відновлює купу за O(n + m)."""
+        self.heapify(self._data + other._data)
+        other._data = []
+
+    def _sift_up(self, index):
+        data, d = self._data, self.d
+        item = data[index]
+        while index > 0:
+            parent = (index - 1) // d
+            if not item < data[parent]:
+                break
+            data[index] = data[parent]
+            index = parent
+        data[index] = item
+
+    def _sift_down(self, index):
+        data, d = self._data, self.d
+        size = len(data)
+        item = data[index]
+        while True:
+            first = d * index + 1
+            if first >= size:
+                break
+            # Найменший з нащадків
+            best = first
+            for child in range(first + 1, min(first + d, size)):
+                if data[child] < data[best]:
+                    best = child
+            if not data[best] < item:
+                break
+            data[index] = data[best]
+            index = best
+        data[index] = item
+
+
+class BinaryHeap(DaryHeap):
+    """Бінарна мін-купа (DaryHeap з d = 2)."""
+
+    def __init__(self, iterable=()):
+        super().__init__(iterable, d=2)
+
+
+class HeapHandle:
+    """Дескриптор елемента IndexedHeap: дозволяє змінити пріоритет або видалити елемент."""
+    __slots__ = ("priority", "item", "index")
+
+    def __init__(self, priority, item):
+        self.priority = priority
+        self.item = item
+        self.index = -1   # позиція в масиві купи, -1 - елемента в купі немає
+
+    def __repr__(self):
+        return f"{self.priority}: {self.item}"
+
+
+class IndexedHeap:
+    """
+    D-арна мін-купа з дескрипторами для планувальників:
+    push повертає HeapHandle, за яким за O(log n) можна зменшити пріоритет
+    (decrease_key) або видалити елемент (remove). Ітерація - дескриптори в порядку масиву.
+    """
+
+    def __init__(self, d=2):
+        if d < 2:
+            raise ValueError("d має бути не менше 2")
+        self.d = d
+        self._data = []
+
+    def __len__(self):
+        return len(self._data)
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __contains__(self, handle):
+        return 0 <= handle.index < len(self._data) and self._data[handle.index] is handle
+
+    def push(self, item, priority):
+        handle = HeapHandle(priority, item)
+        handle.index = len(self._data)
+        self._data.append(handle)
+        self._sift_up(handle.index)
+        return handle
+
+    def heapify(self, pairs):
+        """Замінює вміст купи парами (item, priority) за O(n), як DaryHeap.heapify.
+        Старі дескриптори стають недійсними. Повертає нові дескриптори.
+        """
+        for handle in self._data:
+            handle.index = -1
+        self._data = []
+        return self.extend(pairs)
+
+    def extend(self, pairs):
+        """Додає багато пар (item, priority) за O(n + m) і повертає їхні дескриптори."""
+        handles = [HeapHandle(priority, item) for item, priority in pairs]
+        self._data.extend(handles)
+        self._rebuild()
+        return handles
+
+    def peek(self):
+        if not self._data:
+            raise IndexError("peek з порожньої купи")
+        top = self._data[0]
+        return top.priority, top.item
+
+    def pop(self):
+        if not self._data:
+            raise IndexError("pop з порожньої купи")
+        top = self._data[0]
+        self._remove_at(0)
+        return top.priority, top.item
+
+    def pushpop(self, item, priority):
+        """push, а потім pop за один прохід.
+        Повертає (пріоритет, елемент, дескриптор): дескриптор доданого елемента,
+        або None, якщо саме він і був найменшим (тоді в купу він не потрапляє).
+        """
+        if not self._data or not self._data[0].priority < priority:
+            return priority, item, None
+        top = self._data[0]
+        handle = self._replace_top(item, priority)
+        return top.priority, top.item, handle
+
+    def replace(self, item, priority):
+        """pop, а потім push за один прохід.
+        Повертає (пріоритет, елемент, дескриптор доданого елемента).
+        """
+        top_priority, top_item = self.peek()
+        handle = self._replace_top(item, priority)
+        return top_priority, top_item, handle
+
+    def _replace_top(self, item, priority):
+        handle = HeapHandle(priority, item)
+        handle.index = 0
+        self._data[0].index = -1
+        self._data[0] = handle
+        self._sift_down(0)
+        return handle
+
+    def decrease_key(self, handle, priority):
+        if handle not in self:
+            raise KeyError("елемента немає в купі")
+        if handle.priority < priority:
+            raise ValueError("новий пріоритет більший за поточний")
+        handle.priority = priority
+        self._sift_up(handle.index)
+
+    def remove(self, handle):
+        if handle not in self:
+            raise KeyError("елемента немає в купі")
+        self._remove_at(handle.index)
+
+    def meld(self, other):
+        """Переносить усі елементи other (їхні дескриптори лишаються дійсними) за O(n + m)."""
+        self._data.extend(other._data)
+        other._data = []
+        self._rebuild()
+
+    def _rebuild(self):
+        for index, handle in enumerate(self._data):
+            handle.index = index
+        for index in reversed(range((len(self._data) - 2) // self.d + 1)):
+            self._sift_down(index)
+
+    def _remove_at(self, index):
+        data = self._data
+        removed = data[index]
+        last = data.pop()
+        removed.index = -1
+        if index < len(data):
+            data[index] = last
+            last.index = index
+            # Останній елемент може бути як меншим, так і більшим за видалений
+            if index > 0 and last.priority < data[(index - 1) // self.d].priority:
+                self._sift_up(index)
+            else:
+                self._sift_down(index)
+
+    def _sift_up(self, index):
+        data, d = self._data, self.d
+        handle = data[index]
+        while index > 0:
+            parent = (index - 1) // d
+            if not handle.priority < data[parent].priority:
+                break
+            data[index] = data[parent]
+            data[index].index = index
+            index = parent
+        data[index] = handle
+        handle.index = index
+
+    def _sift_down(self, index):
+        data, d = self._data, self.d
+        size = len(data)
+        handle = data[index]
+        while True:
+            first = d * index + 1
+            if first >= size:
+                break
+            best = first
+            for child in range(first + 1, min(first + d, size)):
+                if data[child].priority < data[best].priority:
+                    best = child
+            if not data[best].priority < handle.priority:
+                break
+            data[index] = data[best]
+            data[index].index = index
+            index = best
+        data[index] = handle
+        handle.index = index
+
+
+def heap_positions(n, d=2):
+    """
+    Координати вузлів d-арної купи з n елементів, обчислені прямо з індексів масиву
+    (без об'єктів Node): рівень level починається з індексу (d**level - 1) / (d - 1),
+    вузол на позиції pos у своєму рівні має x = (2 * pos + 1) / d**level - 1, y = -level.
+    Для d = 2 це те саме розташування, що й у add_edges (зсув ±1/2**layer від батька).
+    """
+    index = np.arange(n)
+    starts = [0]
+    while starts[-1] < n:
+        starts.append(starts[-1] * d + 1)
+    starts = np.array(starts)
+    level = np.searchsorted(starts, index, side="right") - 1
+    pos = index - starts[level]
+    x = (2 * pos + 1) / np.power(float(d), level) - 1
+    return x, -level.astype(float)
+
+
+def draw_heap(heap_list, ax=None, max_labels=127, node_size=None, color="skyblue", d=None):
     """
     Візуалізує бінарну купу у вигляді дерева.
+    heap_list – список у форматі heapq або DaryHeap/BinaryHeap/IndexedHeap
+    d – арність купи; за замовчуванням береться з heap_list.d або 2
+    Позиції рахуються векторно з індексів, ребра малюються одним LineCollection,
+    вузли - одним scatter, тому великі купи малюються швидко.
+    max_labels – якщо елементів більше, значення не підписуються
+    ax – осі для малювання; без них створюється вікно й викликається plt.show()
     """
-    if not heap_list:
+    if not len(heap_list):
         print("Купа порожня")
         return
 
-    root = build_heap_tree(heap_list)
-    draw_tree(root)
+    if d is None:
+        d = getattr(heap_list, "d", 2)
+    heap_list = list(heap_list)
+    n = len(heap_list)
+    x, y = heap_positions(n, d)
+
+    # Ребро від батька (i - 1) // d до кожного вузла i >= 1
+    child = np.arange(1, n)
+    parent = (child - 1) // d
+    segments = np.stack((np.column_stack((x[parent], y[parent])),
+                         np.column_stack((x[child], y[child]))), axis=1)
+
+    show = ax is None
+    if show:
+        plt.figure(figsize=(8, 5))
+        ax = plt.gca()
+
+    labelled = n <= max_labels
+    if node_size is None:
+        node_size = 2500 if labelled else max(1, 2500 * 16 / n)
+
+    ax.add_collection(LineCollection(segments, colors="black", linewidths=1, zorder=1))
+    ax.scatter(x, y, s=node_size, c=color, zorder=2)
+    if labelled:
+        for xi, yi, value in zip(x, y, heap_list):
+            ax.text(xi, yi, str(value), fontsize=12, ha="center", va="center", zorder=3)
+
+    ax.margins(0.1)
+    ax.autoscale_view()
+    ax.axis("off")
+
+    if show:
+        plt.show()
+    return ax
 
 
 if __name__ == "__main__":
@@ -1,8 +1,19 @@
+import argparse
+import itertools
+import os
+import shutil
+import subprocess
 import uuid
-from collections import deque
+from collections import OrderedDict, deque
 
 import networkx as nx
+import matplotlib
+import matplotlib.image as mpimg
 import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
 
 
 class Node:
@@ -13,20 +24,15 @@ class Node:
         self.color = color
         self.id = str(uuid.uuid4())
 
-# Рекурсивна функція для додавання ребер до графа 
+# Функція для додавання ребер до графа (без рекурсії - зі стеком)
 def add_edges(graph, node, pos, x=0, y=0, layer=1):
-    if node is not None:
-        graph.add_node(node.id, color=node.color, label=node.val)
-        if node.left:
-            graph.add_edge(node.id, node.left.id)
-            l = x - 1 / 2 ** layer
-            pos[node.left.id] = (l, y - 1)
-            add_edges(graph, node.left, pos, x=l, y=y - 1, layer=layer + 1)
-        if node.right:
-            graph.add_edge(node.id, node.right.id)
-            r = x + 1 / 2 ** layer
-            pos[node.right.id] = (r, y - 1)
-            add_edges(graph, node.right, pos, x=r, y=y - 1, layer=layer + 1)
+    for current, cx, cy, _, _ in iter_placed(node, "preorder", x, y, layer):
+        graph.add_node(current.id, color=current.color, label=current.val)
+        pos[current.id] = (cx, cy)
+        if current.left:
+            graph.add_edge(current.id, current.left.id)
+        if current.right:
+            graph.add_edge(current.id, current.right.id)
     return graph
 
 # Візуалізація бінарного дерева 
@@ -50,85 +56,284 @@ def draw_tree(tree_root, title="Дерево"):
     plt.show()
 
 
-def collect_nodes(root):
-    """Збирає всі вузли дерева в список (BFS), щоб мати їх для скидання кольорів."""
-    nodes = []
+def iter_placed(root, order="preorder", x=0, y=0, layer=1):
+    """
+    Генератор обходу без рекурсії, що разом з вузлом видає його координати
+    на малюнку: (вузол, x, y, x_батька, y_батька); у кореня батьківські координати - None.
+    order – "preorder" (DFS), "inorder", "postorder", "bfs".
+    Нащадки рівня layer зсуваються на ±1/2**layer від батька, як у add_edges.
+    У пам'яті тримається лише стек (глибина дерева) або черга (ширина рівня).
+    """
     if root is None:
-        return nodes
-    queue = deque([root])
-    while queue:
-        node = queue.popleft()
-        nodes.append(node)
+        return
+
+    # Записи стеку/черги: (готовий_до_видачі, вузол, x, y, layer, x_батька, y_батька)
+    start = (False, root, x, y, layer, None, None)
+
+    def children(entry):
+        _, node, node_x, node_y, node_layer, _, _ = entry
+        shift = 0.5 ** node_layer   # те саме, що 1 / 2 ** layer, але без великих цілих
+        left = right = None
         if node.left:
-            queue.append(node.left)
+            left = (False, node.left, node_x - shift, node_y - 1, node_layer + 1, node_x, node_y)
         if node.right:
-            queue.append(node.right)
-    return nodes
+            right = (False, node.right, node_x + shift, node_y - 1, node_layer + 1, node_x, node_y)
+        return left, right
+
+    if order == "bfs":
+        queue = deque([start])
+        while queue:
+            entry = queue.popleft()
+            yield entry[1], entry[2], entry[3], entry[5], entry[6]
+            queue.extend(child for child in children(entry) if child)
+        return
+
+    if order not in ("preorder", "inorder", "postorder"):
+        raise ValueError(f"Невідомий порядок обходу: {order}")
+
+    stack = [start]
+    while stack:
+        entry = stack.pop()
+        ready, node, node_x, node_y, node_layer, parent_x, parent_y = entry
+        if ready or order == "preorder":
+            yield node, node_x, node_y, parent_x, parent_y
+            if ready:
+                continue
+        left, right = children(entry)
+        # Вузол повертається в стек позначеним "готовим", щоб видати його між/після нащадків
+        itself = (True, node, node_x, node_y, node_layer, parent_x, parent_y)
+        if order == "preorder":
+            sequence = (left, right)
+        elif order == "inorder":
+            sequence = (left, itself, right)
+        else:
+            sequence = (left, right, itself)
+        # Кладемо у зворотному порядку, щоб лівий опрацювався першим
+        stack.extend(item for item in reversed(sequence) if item)
+
+
+def iter_preorder(root):
+    """Прямий обхід у глибину (корінь, лівий, правий) - генератор вузлів."""
+    return (item[0] for item in iter_placed(root, "preorder"))
+
+
+def iter_inorder(root):
+    """Симетричний обхід (лівий, корінь, правий) - генератор вузлів."""
+    return (item[0] for item in iter_placed(root, "inorder"))
+
+
+def iter_postorder(root):
+    """Зворотний обхід (лівий, правий, корінь) - генератор вузлів."""
+    return (item[0] for item in iter_placed(root, "postorder"))
 
 
-def generate_color_gradient(n, start_color="#08306B", end_color="#C6DBEF"):
+def iter_bfs(root):
+    """Обхід у ширину - генератор вузлів."""
+    return (item[0] for item in iter_placed(root, "bfs"))
+
+
+def iter_levels(root):
+    """Обхід по рівнях: генератор списків вузлів кожного рівня."""
+    level = [root] if root is not None else []
+    while level:
+        yield level
+        level = [child for node in level for child in (node.left, node.right) if child]
+
+
+class ArrayTree:
     """
-    Генерує n кольорів від темного до світлого (HEX).
-    start_color, end_color – рядки типу '#RRGGBB'.
+    Компактне бінарне дерево у вигляді структури масивів: вузол - це індекс i,
+    left[i] / right[i] - індекси нащадків (-1 - немає), values[i] - значення,
+    color_index[i] - номер кольору в palette. Ні uuid, ні об'єктів на вузол.
     """
-    def hex_to_rgb(hex_color):
-        hex_color = hex_color.lstrip("#")
-        return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
 
-    def rgb_to_hex(rgb):
-        return "#{:02X}{:02X}{:02X}".format(*rgb)
+    def __init__(self, values, left, right, root=0):
+        self.values = np.asarray(values)
+        self.left = np.asarray(left, dtype=np.int64)
+        self.right = np.asarray(right, dtype=np.int64)
+        self.root = root if len(self.values) else -1
+        self.palette = ["#1296F0"]
+        self.color_index = np.zeros(len(self.values), dtype=np.uint32)
+
+    def __len__(self):
+        return len(self.values)
+
+    @classmethod
+    def complete(cls, values):
+        """Повне дерево як у купі: нащадки вузла i - 2*i + 1 та 2*i + 2."""
+        values = np.asarray(values)
+        n = len(values)
+        index = np.arange(n)
+        left = np.where(2 * index + 1 < n, 2 * index + 1, -1)
+        right = np.where(2 * index + 2 < n, 2 * index + 2, -1)
+        return cls(values, left, right)
+
+    @classmethod
+    def from_nodes(cls, root):
+        """Перетворює дерево з об'єктів Node: індекси вузлів - порядок обходу в ширину."""
+        nodes = bfs_order(root)
+        index = {id(node): i for i, node in enumerate(nodes)}
+        left = [index[id(node.left)] if node.left else -1 for node in nodes]
+        right = [index[id(node.right)] if node.right else -1 for node in nodes]
+        tree = cls([node.val for node in nodes], left, right)
+        # Кольори вузлів переносимо у палітру
+        palette = {}
+        for i, node in enumerate(nodes):
+            tree.color_index[i] = palette.setdefault(node.color, len(palette))
+        if palette:
+            tree.palette = list(palette)
+        return tree
+
+    def to_nodes(self):
+        """Зворотне перетворення у звичайні об'єкти Node. Повертає корінь."""
+        if self.root < 0:
+            return None
+        nodes = [Node(value, color=self.palette[c])
+                 for value, c in zip(self.values.tolist(), self.color_index.tolist())]
+        for node, l, r in zip(nodes, self.left.tolist(), self.right.tolist()):
+            if l >= 0:
+                node.left = nodes[l]
+            if r >= 0:
+                node.right = nodes[r]
+        return nodes[self.root]
+
+    def dfs_order(self):
+        """Прямий обхід у глибину (зі стеком). Повертає масив індексів."""
+        if self.root < 0:
+            return np.empty(0, dtype=np.int64)
+        left = self.left.tolist()
+        right = self.right.tolist()
+        order = []
+        stack = [self.root]
+        while stack:
+            i = stack.pop()
+            order.append(i)
+            if right[i] >= 0:
+                stack.append(right[i])
+            if left[i] >= 0:
+                stack.append(left[i])
+        return np.array(order, dtype=np.int64)
+
+    def bfs_order(self):
+        """Обхід у ширину, векторно рівень за рівнем. Повертає масив індексів."""
+        if self.root < 0:
+            return np.empty(0, dtype=np.int64)
+        levels = []
+        level = np.array([self.root])
+        while level.size:
+            levels.append(level)
+            # Нащадки рівня в порядку: лівий, правий для кожного вузла
+            children = np.column_stack((self.left[level], self.right[level])).ravel()
+            level = children[children >= 0]
+        return np.concatenate(levels)
+
+    def color_by_order(self, order, colors):
+        """Вузол order[k] отримує колір colors[k]; решта - сірі."""
+        self.palette = ["#CCCCCC"] + list(colors)
+        self.color_index[:] = 0
+        self.color_index[np.asarray(order)] = np.arange(1, len(order) + 1)
 
-    start_rgb = hex_to_rgb(start_color)
-    end_rgb = hex_to_rgb(end_color)
 
-    colors = []
-    for i in range(n):
-        t = i / max(1, n - 1)
-        r = int(start_rgb[0] + (end_rgb[0] - start_rgb[0]) * t)
-        g = int(start_rgb[1] + (end_rgb[1] - start_rgb[1]) * t)
-        b = int(start_rgb[2] + (end_rgb[2] - start_rgb[2]) * t)
-        colors.append(rgb_to_hex((r, g, b)))
-    return colors
+def collect_nodes(root):
+    """Збирає всі вузли дерева в список (BFS), щоб мати їх для скидання кольорів."""
+    return list(iter_bfs(root))
 
 
+DEFAULT_GRADIENT = ("#08306B", "#C6DBEF")
 
-def dfs_order(root):
-    """Обхід у глибину (DFS) зі стеком. Повертає список вузлів у порядку відвідування."""
-    if root is None:
-        return []
+# "00".."FF" для кожного байта: HEX-рядки складаються індексуванням, без format на колір
+_HEX_BYTES = np.array([f"{i:02X}" for i in range(256)])
 
-    order = []
-    stack = [root]
 
-    while stack:
-        node = stack.pop()
-        order.append(node)
-        # Спочатку додаємо правого, потім лівого, щоб лівий опрацювався першим
-        if node.right:
-            stack.append(node.right)
-        if node.left:
-            stack.append(node.left)
+def hex_to_rgb(hex_color):
+    """'#RRGGBB' -> (r, g, b) цілими 0..255."""
+    hex_color = hex_color.lstrip("#")
+    return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
 
-    return order
 
+# LRU-кеш палітр (n, stops) -> (rgb, hex). Обмежений сумарною кількістю кольорів,
+# а не кількістю записів: палітра на мільйон вузлів - це мільйон рядків Python
+_GRADIENT_CACHE = OrderedDict()
+_gradient_cache_total = 0   # сума розмірів записів кешу
+GRADIENT_CACHE_COLORS = 2 ** 18
 
-def bfs_order(root):
-    """Обхід у ширину (BFS) з чергою. Повертає список вузлів у порядку відвідування."""
-    if root is None:
-        return []
 
-    order = []
-    queue = deque([root])
+def _cache_cost(n):
+    # Навіть порожня палітра займає місце, тож кожен запис важить щонайменше 1
+    return max(1, n)
 
-    while queue:
-        node = queue.popleft()
-        order.append(node)
-        if node.left:
-            queue.append(node.left)
-        if node.right:
-            queue.append(node.right)
 
-    return order
+def _gradient(n, stops):
+    """
+    Палітра з n кольорів через опорні кольори stops, з кешу або обчислена заново.
+    Повторні малюнки дерев того ж розміру беруть готову палітру; палітри, більші
+    за GRADIENT_CACHE_COLORS, не кешуються, найстаріші записи витісняються.
+    """
+    global _gradient_cache_total
+    key = (n, stops)
+    cached = _GRADIENT_CACHE.get(key)
+    if cached is not None:
+        _GRADIENT_CACHE.move_to_end(key)
+        return cached
+
+    result = _build_gradient(n, stops)
+    if n <= GRADIENT_CACHE_COLORS:
+        _GRADIENT_CACHE[key] = result
+        _gradient_cache_total += _cache_cost(n)
+        while _gradient_cache_total > GRADIENT_CACHE_COLORS:
+            (size, _), _ = _GRADIENT_CACHE.popitem(last=False)
+            _gradient_cache_total -= _cache_cost(size)
+    return result
+
+
+def _build_gradient(n, stops):
+    """
+    Палітра з n кольорів через опорні кольори stops (рівномірно на відрізку [0, 1]),
+    обчислена одним векторним кроком.
+    Повертає (масив RGB форми (n, 3) тільки для читання, кортеж HEX-рядків).
+    """
+    anchors = np.array([hex_to_rgb(color) for color in stops], dtype=float)
+    t = np.arange(n) / max(1, n - 1)
+
+    # Номер відрізка між сусідніми опорними кольорами та положення всередині нього
+    segments = len(stops) - 1
+    scaled = t * segments
+    index = np.minimum(scaled.astype(np.int64), segments - 1)
+    local = (scaled - index)[:, None]
+
+    start = anchors[index]
+    rgb = (start + (anchors[index + 1] - start) * local).astype(np.uint8)
+    rgb.setflags(write=False)
+
+    hex_colors = np.char.add(np.char.add(np.char.add("#", _HEX_BYTES[rgb[:, 0]]),
+                                         _HEX_BYTES[rgb[:, 1]]), _HEX_BYTES[rgb[:, 2]])
+    return rgb, tuple(hex_colors.tolist())
+
+
+def generate_color_gradient(n, start_color=DEFAULT_GRADIENT[0], end_color=DEFAULT_GRADIENT[1],
+                            stops=None, as_rgb=False):
+    """
+    Генерує n кольорів від темного до світлого (HEX).
+    start_color, end_color – рядки типу '#RRGGBB'.
+    stops – послідовність із двох і більше опорних кольорів (замість start/end)
+    as_rgb – повернути масив NumPy форми (n, 3) з uint8 замість HEX-рядків
+    Результат (кортеж HEX-рядків або масив тільки для читання) береться з кешу без копіювання.
+    """
+    stops = tuple(stops) if stops is not None else (start_color, end_color)
+    if len(stops) < 2:
+        raise ValueError("Градієнт потребує щонайменше двох кольорів")
+    rgb, hex_colors = _gradient(n, stops)
+    return rgb if as_rgb else hex_colors
+
+
+def dfs_order(root):
+    """Обхід у глибину (DFS) зі стеком. Повертає список вузлів у порядку відвідування."""
+    return list(iter_preorder(root))
+
+
+def bfs_order(root):
+    """Обхід у ширину (BFS) з чергою. Повертає список вузлів у порядку відвідування."""
+    return list(iter_bfs(root))
 
 
 def color_by_order(root, order, title):
@@ -146,20 +351,242 @@ def color_by_order(root, order, title):
     draw_tree(root, title=title)
 
 
+def draw_traversal(root, order="preorder", title="Дерево", ax=None, max_labels=127):
+    """
+    Малює обхід дерева за один прохід: під час обходу iter_placed кожен вузол
+    отримує номер у порядку відвідування (для кольору), координати та підпис.
+    Ребра малюються одним LineCollection, вузли - одним scatter, тож
+    networkx-граф і окремі списки вузлів не потрібні навіть для дуже великих дерев.
+    ax – осі для малювання; без них створюється вікно й викликається plt.show()
+    """
+    if root is None:
+        return
+
+    xs, ys, labels, nodes, segments = [], [], [], [], []
+    for node, x, y, px, py in iter_placed(root, order):
+        xs.append(x)
+        ys.append(y)
+        nodes.append(node)
+        if len(labels) < max_labels + 1:
+            labels.append(node.val)
+        if px is not None:
+            segments.append(((px, py), (x, y)))
+
+    colors = generate_color_gradient(len(xs))
+    for node, color in zip(nodes, colors):
+        node.color = color
+
+    show = ax is None
+    if show:
+        fig, ax = plt.subplots(figsize=(8, 5.5))
+        try:
+            fig.canvas.manager.set_window_title(title)
+        except Exception:
+            pass
+
+    labelled = len(xs) <= max_labels
+    ax.add_collection(LineCollection(segments, colors="black", linewidths=1, zorder=1))
+    ax.scatter(xs, ys, s=2500 if labelled else max(1, 2500 * 16 / len(xs)), c=colors, zorder=2)
+    if labelled:
+        for x, y, label in zip(xs, ys, labels):
+            ax.text(x, y, str(label), fontsize=12, ha="center", va="center", zorder=3)
+    ax.margins(0.1)
+    ax.autoscale_view()
+    ax.axis("off")
+
+    if show:
+        plt.show()
+
+
+def iter_traversal_frames(root, order="preorder", size=(8, 5.5), dpi=100, step=1,
+                          max_labels=127, title=None):
+    """
+    Генератор кадрів анімації обходу: масиви RGBA форми (висота, ширина, 4),
+    один кадр на кожні step відвіданих вузлів.
+    Розміщення обчислюється один раз (iter_placed), фон з ребрами малюється один раз,
+    а між кадрами змінюються лише кольори вузлів одного scatter (blitting на Agg).
+    Працює без вікна: Figure з FigureCanvasAgg, pyplot не потрібен.
+    """
+    # Перевірка тут, а не в генераторі - помилка виникає одразу під час виклику
+    if step < 1:
+        raise ValueError("step має бути не менше 1")
+    return _traversal_frames(root, order, size, dpi, step, max_labels, title)
+
+
+def _traversal_frames(root, order, size, dpi, step, max_labels, title):
+    if root is None:
+        return
+
+    xs, ys, labels, segments = [], [], [], []
+    for node, x, y, px, py in iter_placed(root, order):
+        xs.append(x)
+        ys.append(y)
+        if len(labels) < max_labels + 1:
+            labels.append(node.val)
+        if px is not None:
+            segments.append(((px, py), (x, y)))
+
+    n = len(xs)
+    # Вузол k у масивах - k-й відвіданий, тож кадр k просто фарбує перші k+1 вузлів
+    gradient = np.ones((n, 4))
+    gradient[:, :3] = generate_color_gradient(n, as_rgb=True) / 255
+    facecolors = np.tile(np.array([0.8, 0.8, 0.8, 1.0]), (n, 1))
+
+    fig = Figure(figsize=size, dpi=dpi)
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    if title:
+        ax.set_title(title)
+
+    labelled = n <= max_labels
+    ax.add_collection(LineCollection(segments, colors="black", linewidths=1, zorder=1))
+    # animated=True: ці артисти не входять у фон і домальовуються на кожному кадрі
+    nodes = ax.scatter(xs, ys, s=2500 if labelled else max(1, 2500 * 16 / n),
+                       c=facecolors, zorder=2, animated=True)
+    texts = []
+    if labelled:
+        texts = [ax.text(x, y, str(label), fontsize=12, ha="center", va="center",
+                         zorder=3, animated=True)
+                 for x, y, label in zip(xs, ys, labels)]
+    ax.margins(0.1)
+    ax.autoscale_view()
+    ax.axis("off")
+
+    canvas.draw()
+    background = canvas.copy_from_bbox(fig.bbox)
+
+    for stop in list(range(step, n, step)) + [n]:
+        facecolors[:stop] = gradient[:stop]
+        nodes.set_facecolors(facecolors)
+        canvas.restore_region(background)
+        ax.draw_artist(nodes)
+        for text in texts:
+            ax.draw_artist(text)
+        yield np.array(canvas.buffer_rgba())
+
+
+def _write_png_sequence(frames, directory):
+    os.makedirs(directory, exist_ok=True)
+    count = 0
+    for count, frame in enumerate(frames, 1):
+        mpimg.imsave(os.path.join(directory, f"frame_{count:05d}.png"), frame)
+    return count
+
+
+def _write_gif(frames, output, fps):
+    """Pillow збирає всі кадри GIF перед записом, тому їх зберігаємо у палітровому вигляді (1 байт на піксель)."""
+    from PIL import Image   # Pillow - обов'язкова залежність matplotlib
+
+    images = [Image.fromarray(frame).convert("RGB").quantize() for frame in frames]
+    if not images:
+        return 0
+    images[0].save(output, save_all=True, append_images=images[1:],
+                   duration=int(1000 / fps), loop=0)
+    return len(images)
+
+
+def _write_video(frames, output, fps):
+    """Кадри по одному передаються в ffmpeg через канал, на диску їх не буває."""
+    ffmpeg = shutil.which(matplotlib.rcParams["animation.ffmpeg_path"])
+    if ffmpeg is None:
+        raise RuntimeError("Для відео потрібен ffmpeg; збережіть анімацію як .gif або PNG-кадри")
+
+    first = next(frames, None)
+    if first is None:
+        return 0
+    height, width = first.shape[:2]
+    command = [ffmpeg, "-y", "-loglevel", "error",
+               "-f", "rawvideo", "-pix_fmt", "rgba", "-s", f"{width}x{height}",
+               "-r", str(fps), "-i", "-",
+               # libx264 + yuv420p потребують парних розмірів кадру
+               "-vf", "pad=ceil(iw/2)*2:ceil(ih/2)*2", "-pix_fmt", "yuv420p", output]
+    count = 0
+    with subprocess.Popen(command, stdin=subprocess.PIPE) as process:
+        for count, frame in enumerate(itertools.chain([first], frames), 1):
+            process.stdin.write(frame.tobytes())
+        process.stdin.close()
+        if process.wait():
+            raise RuntimeError(f"ffmpeg завершився з кодом {process.returncode}")
+    return count
+
+
+def save_traversal_animation(root, output, order="preorder", fps=4, **frame_options):
+    """
+    Зберігає анімацію обходу без вікна.
+    output – '*.gif' (Pillow), '*.mp4' / '*.webm' / ... (ffmpeg) або каталог,
+             куди записується послідовність frame_00001.png, ...
+    frame_options – параметри iter_traversal_frames (size, dpi, step, max_labels, title)
+    Кадри генеруються потоком, тож відео й PNG не тримають усю анімацію в пам'яті.
+    Повертає кількість записаних кадрів.
+    """
+    frames = iter_traversal_frames(root, order, **frame_options)
+    ext = os.path.splitext(os.fspath(output))[1].lower()
+    if not ext:
+        return _write_png_sequence(frames, output)
+    if ext == ".gif":
+        return _write_gif(frames, output, fps)
+    return _write_video(frames, output, fps)
+
+
+def _positive_int(text):
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError("має бути не менше 1")
+    return value
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Візуалізація обходів бінарного дерева.")
+    parser.add_argument("--order", choices=["preorder", "inorder", "postorder", "bfs"],
+                        nargs="+", default=["preorder", "bfs"], help="порядки обходу")
+    parser.add_argument("--nodes", type=int,
+                        help="повне дерево з такою кількістю вузлів (без нього - приклад з 7 вузлів)")
+    parser.add_argument("--output", "-o",
+                        help="файл анімації (.gif, .mp4) або каталог для PNG-кадрів; "
+                             "при кількох порядках до імені додається назва обходу")
+    parser.add_argument("--fps", type=float, default=4)
+    parser.add_argument("--step", type=_positive_int, default=1,
+                        help="скільки нових вузлів фарбується за кадр")
+    parser.add_argument("--size", type=float, nargs=2, default=[8, 5.5], metavar=("W", "H"))
+    parser.add_argument("--dpi", type=int, default=100)
+    return parser.parse_args(argv)
+
+
+def _output_for(output, order, many):
+    if not many:
+        return output
+    base, ext = os.path.splitext(output)
+    return f"{base}_{order}{ext}"
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    if args.nodes:
+        root = ArrayTree.complete(np.arange(1, args.nodes + 1)).to_nodes()
+    else:
+        # Створюємо приклад дерева для демонстрації обходів (DFS і BFS)
+        root = Node(1)
+        root.left = Node(2)
+        root.right = Node(3)
+        root.left.left = Node(4)
+        root.left.right = Node(5)
+        root.right.left = Node(6)
+        root.right.right = Node(7)
+
+    titles = {"preorder": "Обхід у глибину (DFS)", "inorder": "Симетричний обхід",
+              "postorder": "Зворотний обхід", "bfs": "Обхід у ширину (BFS)"}
+
+    for order in args.order:
+        if args.output:
+            output = _output_for(args.output, order, len(args.order) > 1)
+            count = save_traversal_animation(root, output, order, fps=args.fps, step=args.step,
+                                             size=tuple(args.size), dpi=args.dpi,
+                                             title=titles[order])
+            print(f"Збережено {count} кадрів: {output}")
+        else:
+            draw_traversal(root, order, title=titles[order])
+
+
 if __name__ == "__main__":
-    # Створюємо приклад дерева для демонстрації обходів (DFS і BFS) 
-    root = Node(1)
-    root.left = Node(2)
-    root.right = Node(3)
-    root.left.left = Node(4)
-    root.left.right = Node(5)
-    root.right.left = Node(6)
-    root.right.right = Node(7)
-
-    # DFS
-    dfs_nodes = dfs_order(root)
-    color_by_order(root, dfs_nodes, title="Обхід у глибину (DFS)")
-
-    # BFS
-    bfs_nodes = bfs_order(root)
-    color_by_order(root, bfs_nodes, title="Обхід у ширину (BFS)")
\ No newline at end of file
+    main()
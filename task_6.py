@@ -1,3 +1,5 @@
+import numpy as np
+
 items = {
     "pizza": {"cost": 50, "calories": 300},
     "hamburger": {"cost": 40, "calories": 250},
@@ -39,51 +41,100 @@ def greedy_algorithm(items: dict, budget: int):
     return chosen, total_cost, total_calories
 
 
-def dynamic_programming(items: dict, budget: int):
+# Скільки пам'яті може займати бітова таблиця рішень; більші задачі ділимо навпіл (Гіршберг)
+MAX_DECISION_BYTES = 64 * 2 ** 20
+
+
+def _best_calories(costs, calories, budget):
     """
-    Алгоритм динамічного програмування:
-    Кожну страву можна взяти або 0 або 1 раз.
-    Будуємо таблицю dp[i][w] — максимум калорій, який можна отримати,
-    використовуючи перші i страв і бюджет w.
-    Повертає: обрана_їжа, загальна_вартість, загальна_калорійність.
+    Одновимірний рядок DP: best[w] - максимум калорій при бюджеті не більше w.
+    Кожна страва обробляється одним векторним кроком: зсув рядка на її вартість + калорії.
     """
-    # Перетворимо словник у списки для зручності
-    names = list(items.keys())
-    costs = [items[name]["cost"] for name in names]
-    calories = [items[name]["calories"] for name in names]
-    n = len(names)
-
-    # dp[i][w] – максимум калорій, використовуючи перші i предметів при бюджеті w
-    dp = [[0] * (budget + 1) for _ in range(n + 1)]
-
-    # Заповнюємо таблицю
-    for i in range(1, n + 1):
-        cost_i = costs[i - 1]
-        cal_i = calories[i - 1]
-        for w in range(budget + 1):
-            # Не беремо i-ту страву 
-            dp[i][w] = dp[i - 1][w]
-            # Пробуємо взяти, якщо вистачає бюджету
-            if cost_i <= w:
-                dp[i][w] = max(dp[i][w], dp[i - 1][w - cost_i] + cal_i)
-
-    # Максимальна калорійність при повному бюджеті
-    max_calories = dp[n][budget]
-
-    # Відновлюємо вибір страв (йдемо назад по таблиці)
+    best = np.zeros(budget + 1, dtype=calories.dtype)
+    for cost, cal in zip(costs.tolist(), calories.tolist()):
+        if cost <= budget:
+            # Права частина обчислюється зі старого рядка до запису - страва береться не більше разу
+            np.maximum(best[cost:], best[:budget + 1 - cost] + cal, out=best[cost:])
+    return best
+
+
+def _choose_with_bitset(costs, calories, budget):
+    """
+    Той самий рядок DP, але для кожної страви запам'ятовується біт "взяли" для кожного бюджету,
+    упакований np.packbits: n * (budget + 1) / 8 байтів замість таблиці n x budget чисел.
+    Повертає індекси обраних страв у порядку зростання.
+    """
+    n = len(costs)
+    best = np.zeros(budget + 1, dtype=calories.dtype)
+    decisions = np.zeros((n, (budget + 8) // 8), dtype=np.uint8)
+    for i, (cost, cal) in enumerate(zip(costs.tolist(), calories.tolist())):
+        if cost > budget:
+            continue
+        candidate = best[:budget + 1 - cost] + cal
+        take = np.zeros(budget + 1, dtype=bool)
+        # Беремо лише при строгому покращенні - як у класичній таблиці dp[i][w] != dp[i-1][w]
+        np.greater(candidate, best[cost:], out=take[cost:])
+        np.maximum(best[cost:], candidate, out=best[cost:])
+        decisions[i] = np.packbits(take)
+
+    # Відновлюємо вибір, ідучи по бітах від останньої страви
     chosen = []
     w = budget
-    total_cost = 0
+    for i in range(n - 1, -1, -1):
+        if decisions[i, w >> 3] >> (7 - (w & 7)) & 1:
+            chosen.append(i)
+            w -= int(costs[i])
+    chosen.reverse()
+    return chosen
 
-    for i in range(n, 0, -1):
-        if dp[i][w] != dp[i - 1][w]:
-            # Це означає, що i-та страва була взята
-            name = names[i - 1]
-            chosen.append(name)
-            total_cost += costs[i - 1]
-            w -= costs[i - 1]
 
-    chosen.reverse()  # щоб порядок відповідав початковому
+def _choose(costs, calories, budget, offset, max_bytes):
+    """
+    Розділяй і володарюй у стилі Гіршберга: рядок DP для першої половини страв
+    і для другої половини, розбиття бюджету w* = argmax(left[w] + right[budget - w]),
+    далі кожна половина розв'язується зі своєю частиною бюджету.
+    Пам'ять - O(budget), час - O(n * budget * log n). Невеликі частини - через бітову таблицю.
+    """
+    n = len(costs)
+    if n == 0 or budget < 0:
+        return []
+    if n == 1 or n * (budget + 8) // 8 <= max_bytes:
+        return [offset + i for i in _choose_with_bitset(costs, calories, budget)]
+
+    mid = n // 2
+    left = _best_calories(costs[:mid], calories[:mid], budget)
+    right = _best_calories(costs[mid:], calories[mid:], budget)
+    split = int(np.argmax(left + right[::-1]))
+
+    return (_choose(costs[:mid], calories[:mid], split, offset, max_bytes)
+            + _choose(costs[mid:], calories[mid:], budget - split, offset + mid, max_bytes))
+
+
+def dynamic_programming(items: dict, budget: int, max_decision_bytes=MAX_DECISION_BYTES):
+    """
+    Алгоритм динамічного програмування:
+    Кожну страву можна взяти або 0 або 1 раз.
+    Замість таблиці dp[i][w] тримається один рядок best[w] (максимум калорій при бюджеті w),
+    який оновлюється векторно NumPy для кожної страви.
+    Вибір страв відновлюється з бітової таблиці рішень; якщо вона більша за
+    max_decision_bytes, задача ділиться навпіл за Гіршбергом і пам'ять лишається O(budget).
+    Повертає: обрана_їжа, загальна_вартість, загальна_калорійність.
+    """
+    if budget < 0:
+        raise ValueError("Бюджет не може бути від'ємним")
+
+    names = list(items.keys())
+    costs = np.array([items[name]["cost"] for name in names], dtype=np.int64)
+    calories = np.array([items[name]["calories"] for name in names])
+    if calories.dtype.kind in "iub":
+        calories = calories.astype(np.int64)
+    if (costs < 0).any():
+        raise ValueError("Вартість страви не може бути від'ємною")
+
+    chosen_indices = _choose(costs, calories, budget, 0, max_decision_bytes)
+    chosen = [names[i] for i in chosen_indices]   # порядок відповідає початковому
+    total_cost = int(costs[chosen_indices].sum())
+    max_calories = calories[chosen_indices].sum().item() if chosen_indices else 0
 
     return chosen, total_cost, max_calories
 